@@ -75,9 +75,16 @@ class LLMClient:
 
     # ----- public -----------------------------------------------------------
 
-    async def analyze(self, prompt: str, data: str = "") -> dict | str:
+    async def analyze(
+        self, prompt: str, data: str = "", cache_prompt: bool = False,
+    ) -> dict | str:
         """Send *prompt* (optionally with *data* appended) to the active
-        provider and return parsed JSON or raw text."""
+        provider and return parsed JSON or raw text.
+
+        cache_prompt marks the whole prompt for provider-side prompt
+        caching, for prompts that are likely to be sent again unchanged
+        within a few minutes (e.g. a regenerated report).
+        """
 
         if not self.provider:
             raise ValueError("No AI provider configured. Go to Settings to set one up.")
@@ -104,23 +111,35 @@ class LLMClient:
             "openai": self._call_openai,
             "gemini": self._call_gemini,
         }
-        raw_text = await dispatch[self.provider](full_prompt)
+        raw_text = await dispatch[self.provider](full_prompt, cache_prompt)
         return self._parse_response(raw_text)
 
     # ----- private: provider calls -----------------------------------------
 
-    async def _call_claude(self, prompt: str) -> str:
+    async def _call_claude(self, prompt: str, cache_prompt: bool = False) -> str:
         """Call the Anthropic Messages API (sync SDK wrapped for async)."""
         client = anthropic.Anthropic(api_key=self.api_key)
+        content = prompt
+        if cache_prompt:
+            # Caching is opt-in per block; prompts under the model's minimum
+            # cacheable length are simply sent uncached
+            content = [{
+                "type": "text", "text": prompt,
+                "cache_control": {"type": "ephemeral"},
+            }]
         message = client.messages.create(
             model=PROVIDER_MODELS["claude"],
             max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}],
+            messages=[{"role": "user", "content": content}],
         )
         return message.content[0].text
 
-    async def _call_openai(self, prompt: str) -> str:
-        """Call the OpenAI Chat Completions API."""
+    async def _call_openai(self, prompt: str, cache_prompt: bool = False) -> str:
+        """Call the OpenAI Chat Completions API.
+
+        OpenAI caches long prompt prefixes automatically, so cache_prompt
+        needs no request changes here.
+        """
         client = openai.OpenAI(api_key=self.api_key)
         response = client.chat.completions.create(
             model=PROVIDER_MODELS["openai"],
@@ -130,8 +149,8 @@ class LLMClient:
         )
         return response.choices[0].message.content
 
-    async def _call_gemini(self, prompt: str) -> str:
-        """Call the Google Generative AI (Gemini) API."""
+    async def _call_gemini(self, prompt: str, cache_prompt: bool = False) -> str:
+        """Call the Google Generative AI (Gemini) API (cache_prompt is ignored)."""
         genai.configure(api_key=self.api_key)
         model = genai.GenerativeModel(PROVIDER_MODELS["gemini"])
         response = model.generate_content(prompt)
@@ -159,15 +159,29 @@ class NotebookLMBridge:
         queries: list[dict],
         progress_cb: Callable[[float, str], None] | None = None,
         keep_alive: bool = False,
+        answer_cb: Callable[[str, str], None] | None = None,
+        concurrency: int = 1,
     ) -> dict:
         """Create a notebook, upload comments, run all queries, return parsed results.
 
         Args:
             comments_md: Markdown-formatted comments to upload as source.
             topic: The research topic (used for notebook/source title).
-            queries: List of query dicts with 'id' and 'question' keys.
+            queries: List of query dicts with 'id' and 'question' keys, and
+                an optional 'needs_history' flag for queries that build on
+                the earlier answers.
             progress_cb: Optional callback(progress_float, status_message).
             keep_alive: If True, keep the notebook alive for interactive chat.
+            answer_cb: Optional callback(query_id, answer), called as soon as
+                each query finishes so callers can show answers incrementally.
+            concurrency: How many queries may be in flight at once. With 1,
+                every query is asked in order in one conversation. With more,
+                the first query opens the conversation kept for chat and the
+                other independent queries are asked in parallel with no
+                conversation (outside the chat session). Their answers are
+                then added as an "Earlier analyses" source, and the
+                'needs_history' queries are asked in order in the kept
+                conversation.
 
         Returns:
             Dict with "answers" key mapping query IDs to answer strings.
@@ -199,33 +213,96 @@ class NotebookLMBridge:
             parsed_results = {}
             conversation_id = None
 
-            for i, q in enumerate(queries):
+            async def _ask(q: dict, conversation: str | None) -> str | None:
+                """Ask one query, record its answer, return its conversation id."""
                 qid = q["id"]
-                question = q["question"]
-                progress_pct = 0.15 + (0.80 * (i + 1) / len(queries))
-
-                if progress_cb:
-                    progress_cb(
-                        progress_pct,
-                        f"Querying ({i+1}/{len(queries)}): "
-                        f"{qid.replace('_', ' ').title()}...",
-                    )
-
                 try:
                     result = await self._client.chat.ask(
                         nb.id,
-                        question,
-                        conversation_id=conversation_id,
+                        q["question"],
+                        conversation_id=conversation,
                     )
-                    parsed_results[qid] = result.answer
-                    conversation_id = result.conversation_id
                 except Exception as e:
                     logger.warning("Query '%s' failed: %s", qid, e)
                     parsed_results[qid] = ""
+                    result = None
+                else:
+                    parsed_results[qid] = result.answer
 
-                # Rate-limit pause between queries (important for 10-query runs)
-                if i < len(queries) - 1:
-                    await asyncio.sleep(2)
+                if answer_cb:
+                    answer_cb(qid, parsed_results[qid])
+                return result.conversation_id if result is not None else None
+
+            def _report(done: int, msg: str):
+                if progress_cb:
+                    progress_cb(0.15 + (0.80 * done / len(queries)), msg)
+
+            if concurrency <= 1:
+                for i, q in enumerate(queries):
+                    _report(
+                        i + 1,
+                        f"Querying ({i+1}/{len(queries)}): "
+                        f"{q['id'].replace('_', ' ').title()}...",
+                    )
+                    conversation_id = await _ask(q, conversation_id) or conversation_id
+
+                    # Rate-limit pause between queries (important for 10-query runs)
+                    if i < len(queries) - 1:
+                        await asyncio.sleep(2)
+            elif queries:
+                independent = [q for q in queries if not q.get("needs_history")]
+                dependent = [q for q in queries if q.get("needs_history")]
+                done = 0
+
+                if independent:
+                    # The first query opens the conversation kept for chat; the
+                    # rest run in parallel outside it (conversation None), each
+                    # slot keeping the rate-limit pause
+                    _report(1, f"Querying (1/{len(queries)}): "
+                               f"{independent[0]['id'].replace('_', ' ').title()}...")
+                    conversation_id = await _ask(independent[0], None)
+                    done = 1
+                    sem = asyncio.Semaphore(concurrency)
+
+                    async def _ask_bounded(q: dict):
+                        nonlocal done
+                        async with sem:
+                            await asyncio.sleep(2)
+                            await _ask(q, None)
+                        done += 1
+                        _report(done, f"Answered {done}/{len(queries)} queries...")
+
+                    await asyncio.gather(*[_ask_bounded(q) for q in independent[1:]])
+
+                if dependent:
+                    # The parallel answers aren't in the chat history, so they
+                    # are added as a source before the queries that build on them
+                    earlier = "\n\n".join(
+                        f"## {q['id'].replace('_', ' ').title()}\n\n{parsed_results[q['id']]}"
+                        for q in independent if parsed_results.get(q["id"])
+                    )
+                    if earlier:
+                        try:
+                            await self._client.sources.add_text(
+                                nb.id,
+                                title=f"Earlier analyses: {topic}",
+                                content=earlier,
+                                wait=True,
+                                wait_timeout=120.0,
+                            )
+                        except Exception as e:
+                            logger.warning("Could not add earlier analyses: %s", e)
+
+                    # In order, in the kept conversation
+                    for q in dependent:
+                        done += 1
+                        _report(done, f"Querying ({done}/{len(queries)}): "
+                                      f"{q['id'].replace('_', ' ').title()}...")
+                        await asyncio.sleep(2)
+                        conversation_id = await _ask(q, conversation_id) or conversation_id
+
+                # Keep the answers in query order
+                parsed_results = {q["id"]: parsed_results[q["id"]] for q in queries}
 
             if progress_cb:
                 progress_cb(1.0, "Analysis complete!")
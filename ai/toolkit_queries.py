@@ -6,7 +6,10 @@ automated execution via the NotebookLM bridge.
 
 Execution order follows the toolkit's recommended progressive
 context build (each query can reference previous answers via
-NLM session continuity).
+NLM session continuity). Queries that rely on those answers are
+flagged "needs_history"; when the other queries run in parallel, the
+bridge asks these last, in the kept session, with the earlier answers
+added as a source.
 """
 
 
@@ -239,6 +242,7 @@ def get_toolkit_queries(
         # 7. Persona Interview (Prompt 5 — converted to non-interactive)
         {
             "id": "persona_interview",
+            "needs_history": True,
             "question": f"""{ctx}
 
 จาก Persona ที่สร้างขึ้นในการวิเคราะห์ก่อนหน้านี้ (Comment-Born Persona) ให้สร้าง Persona Profile Cards แบบละเอียดสำหรับแต่ละ persona
@@ -331,6 +335,7 @@ insight ที่เห็นได้จากการมอง "ข้าม
         # 10. Full Synthesis (Prompt 10)
         {
             "id": "full_synthesis",
+            "needs_history": True,
             "question": f"""{ctx}
 
 คุณคือ Chief Strategy Officer ที่ต้องนำเสนอ Customer Insight Report ต่อ CEO
@@ -2,10 +2,12 @@
 Keyword extraction using TF-IDF, frequency analysis, n-grams, and word cloud.
 """
 
+import heapq
 import os
 import re
 from collections import Counter
 from io import BytesIO
+from operator import itemgetter
 
 from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 
@@ -160,9 +162,9 @@ def analyze_keywords(comments: list[dict], top_n: int = 30) -> dict:
         tfidf_matrix = tfidf.fit_transform(texts)
         feature_names = tfidf.get_feature_names_out()
         scores = tfidf_matrix.sum(axis=0).A1
-        tfidf_keywords = sorted(
-            zip(feature_names, scores), key=lambda x: x[1], reverse=True
-        )[:top_n]
+        tfidf_keywords = heapq.nlargest(
+            top_n, zip(feature_names, scores), key=itemgetter(1)
+        )
     except Exception:
         pass
 
@@ -227,8 +229,6 @@ def _extract_ngrams(texts: list[str], n: int, top_n: int = 15) -> list[tuple]:
         matrix = vec.fit_transform(texts)
         feature_names = vec.get_feature_names_out()
         counts = matrix.sum(axis=0).A1
-        return sorted(
-            zip(feature_names, counts), key=lambda x: x[1], reverse=True
-        )[:top_n]
+        return heapq.nlargest(top_n, zip(feature_names, counts), key=itemgetter(1))
     except Exception:
         return []
@@ -4,6 +4,7 @@ Temporal analysis — comment volume over time and peak patterns.
 
 from collections import Counter
 from datetime import datetime
+from operator import itemgetter
 
 
 def _parse_date(date_str: str) -> datetime | None:
@@ -88,8 +89,8 @@ def analyze_temporal(comments: list[dict]) -> dict:
     by_day_of_week = [(d, day_counts.get(d, 0)) for d in day_names]
 
     # Peak hour and day
-    peak_hour = max(by_hour, key=lambda x: x[1])[0]
-    peak_day = max(by_day_of_week, key=lambda x: x[1])[0]
+    peak_hour = max(by_hour, key=itemgetter(1))[0]
+    peak_day = max(by_day_of_week, key=itemgetter(1))[0]
 
     # Date range
     earliest = min(parsed_dates)
@@ -9,12 +9,44 @@ Steps:
   4. Results — comments table, analysis dashboard, AI Customer Insight
 """
 
-import re
+import asyncio
+import heapq
+import json
+import os
+import threading
 import streamlit as st
 import pandas as pd
+from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 
+from ai.prompts import CUSTOMER_INSIGHT_REPORT, format_comments_for_prompt
+from ai.toolkit_queries import TOOLKIT_TAB_CONFIG, get_toolkit_queries
+from ai.toolkit_renderer import render_toolkit_report
+from search.pipeline import (
+    step_generate_queries,
+    step_generate_queries_nlm,
+    step_scrape_and_analyze,
+    step_search_urls_async,
+    unique_clean_queries,
+)
+from utils.analysis_ui import compose_platform_comparison, render_platform_comparison
 from utils.async_runner import run_async
+from utils.common import (
+    export_csv_bytes,
+    export_json_bytes,
+    fmt_num,
+    load_cookies_as_list,
+    load_css,
+)
+from utils.notebooklm_export import export_comments_markdown
+from utils.one_search_progress import OneSearchProgress, step_indicator_html
+from utils.stats_report import compose_stats_report, render_stats_report
+
+try:
+    from config.gating import check_feature
+except ImportError:
+    check_feature = None
 
 st.set_page_config(
     page_title="One Search — Comment Scraper",
@@ -23,10 +55,11 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-# Load custom CSS
-css_path = Path(__file__).parent.parent / "assets" / "style.css"
-if css_path.exists():
-    st.markdown(f"<style>{css_path.read_text()}</style>", unsafe_allow_html=True)
+# Load custom CSS — re-emitted every run (elements not re-emitted on a rerun
+# are removed), but the file is only read again when it changes
+css = load_css(Path(__file__).parent.parent / "assets" / "style.css")
+if css:
+    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 # Navigation
 from utils.nav import render_nav
@@ -44,21 +77,14 @@ st.markdown(
 # Check tier access
 st.session_state.setdefault("user_tier", "pro")
 st.session_state.setdefault("active_provider", "notebooklm")
-try:
-    from config.gating import check_feature
-    if not check_feature("one_search"):
-        st.stop()
-except ImportError:
-    pass
+if check_feature is not None and not check_feature("one_search"):
+    st.stop()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Workflow state
 # ═══════════════════════════════════════════════════════════════════════════
 
-_STEP_LABELS = ["Input", "Queries", "URLs", "Scraping", "Results"]
-
-
 def _is_nlm_mode() -> bool:
     """Check if NotebookLM is the active analysis provider."""
     return st.session_state.get("active_provider") == "notebooklm"
@@ -66,9 +92,7 @@ def _is_nlm_mode() -> bool:
 
 def _get_wf() -> dict:
     """Get or initialize workflow state."""
-    if "os_wf" not in st.session_state:
-        st.session_state["os_wf"] = {"step": 0}
-    return st.session_state["os_wf"]
+    return st.session_state.setdefault("os_wf", {"step": 0})
 
 
 def _reset_wf():
@@ -86,44 +110,42 @@ def _reset_wf():
     st.session_state["os_wf"] = {"step": 0}
 
 
+def _go_to_step(step: int):
+    """Button callback: switch steps before the click's rerun draws the page."""
+    _get_wf()["step"] = step
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Query display helpers — hide Google operators from user
 # ═══════════════════════════════════════════════════════════════════════════
 
-def _strip_operators(query: str) -> str:
-    """Strip Google dork operators from a query for user-friendly display.
+_SITE_MAP = {
+    "youtube": "youtube.com",
+    "tiktok": "tiktok.com",
+    "facebook": "facebook.com",
+    "instagram": "instagram.com",
+}
+
+_DATE_RANGE_DAYS = {
+    "3days": 3, "week": 7, "2weeks": 14, "month": 30,
+    "3months": 90, "6months": 180, "year": 365,
+}
 
-    Removes: site:..., after:..., before:..., intitle:, inurl:, -inurl:...
-    Keeps the actual search terms.
-    """
-    q = query
-    # Remove site:anything (including site:youtube.com/shorts)
-    q = re.sub(r'site:\S+', '', q)
-    # Remove after:YYYY-MM-DD and before:YYYY-MM-DD
-    q = re.sub(r'(?:after|before):\d{4}-\d{2}-\d{2}', '', q)
-    # Remove intitle: and -inurl: prefixes
-    q = re.sub(r'-?(?:intitle|inurl):', '', q)
-    # Collapse whitespace
-    q = re.sub(r'\s+', ' ', q).strip()
-    return q
 
+def _operator_affixes(platform: str, date_range) -> tuple[str, str]:
+    """Return the (prefix, suffix) that re-add Google operators to a clean query.
 
-def _restore_operators(clean_query: str, platform: str, date_range) -> str:
-    """Re-add Google operators to a clean query for actual search execution.
+    Computed once per platform, so restoring a query is one f-string:
+    f"{prefix}{query}{suffix}".
 
     Args:
         date_range: str preset (e.g. "week") or dict {"after": "...", "before": "..."} for custom.
     """
-    site_map = {
-        "youtube": "youtube.com",
-        "tiktok": "tiktok.com",
-        "facebook": "facebook.com",
-        "instagram": "instagram.com",
-    }
-    site = site_map.get(platform, "")
-    parts = [f"site:{site}", clean_query] if site else [clean_query]
+    site = _SITE_MAP.get(platform, "")
+    prefix = f"site:{site} " if site else ""
 
     # Add date filter
+    parts = []
     if isinstance(date_range, dict):
         # Custom range with both after and before
         if date_range.get("after"):
@@ -131,17 +153,13 @@ def _restore_operators(clean_query: str, platform: str, date_range) -> str:
         if date_range.get("before"):
             parts.append(f"before:{date_range['before']}")
     elif date_range and date_range != "any":
-        from datetime import datetime, timedelta
-        now = datetime.now()
-        days = {
-            "3days": 3, "week": 7, "2weeks": 14, "month": 30,
-            "3months": 90, "6months": 180, "year": 365,
-        }.get(date_range, 0)
+        days = _DATE_RANGE_DAYS.get(date_range, 0)
         if days:
-            after = (now - timedelta(days=days)).strftime("%Y-%m-%d")
+            after = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
             parts.append(f"after:{after}")
+    suffix = "".join(f" {p}" for p in parts)
 
-    return " ".join(parts)
+    return prefix, suffix
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -150,49 +168,7 @@ def _restore_operators(clean_query: str, platform: str, date_range) -> str:
 
 def _render_step_indicator(current_step: int):
     """Render a horizontal step progress bar."""
-    step_labels = _STEP_LABELS
-    steps_html = ""
-    for i, label in enumerate(step_labels):
-        if i < current_step:
-            cls = "osstep-done"
-            icon = "&#10003;"
-        elif i == current_step:
-            cls = "osstep-active"
-            icon = str(i + 1)
-        else:
-            cls = "osstep-pending"
-            icon = str(i + 1)
-        connector = '<span class="osstep-connector"></span>' if i > 0 else ""
-        steps_html += (
-            f'{connector}'
-            f'<span class="osstep {cls}">'
-            f'<span class="osstep-icon">{icon}</span>'
-            f'<span class="osstep-label">{label}</span>'
-            f'</span>'
-        )
-
-    st.markdown(
-        '<style>'
-        '.osstep-bar{display:flex;align-items:center;justify-content:center;'
-        'gap:0;margin:0.5rem 0 1.5rem 0;flex-wrap:wrap}'
-        '.osstep{display:inline-flex;align-items:center;gap:0.3rem;'
-        'padding:6px 14px;border-radius:8px;font-size:0.82rem;font-weight:500}'
-        '.osstep-icon{width:22px;height:22px;border-radius:50%;display:inline-flex;'
-        'align-items:center;justify-content:center;font-size:0.72rem;font-weight:700}'
-        '.osstep-done{color:#34D399}'
-        '.osstep-done .osstep-icon{background:rgba(52,211,153,0.15);color:#34D399}'
-        '.osstep-active{color:#3B82F6;background:rgba(59,130,246,0.08)}'
-        '.osstep-active .osstep-icon{background:rgba(59,130,246,0.18);color:#3B82F6}'
-        '.osstep-pending{color:#64748B}'
-        '.osstep-pending .osstep-icon{background:rgba(100,116,139,0.1);color:#64748B}'
-        '.osstep-connector{width:28px;height:2px;background:rgba(255,255,255,0.08);'
-        'display:inline-block;margin:0 2px}'
-        '.osstep-done+.osstep-connector,.osstep-connector+.osstep-done .osstep-connector'
-        '{background:rgba(52,211,153,0.3)}'
-        '</style>'
-        f'<div class="osstep-bar">{steps_html}</div>',
-        unsafe_allow_html=True,
-    )
+    st.markdown(step_indicator_html(current_step), unsafe_allow_html=True)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -201,9 +177,6 @@ def _render_step_indicator(current_step: int):
 
 def _render_api_config():
     """Render compact API configuration section."""
-    import json
-    import os
-
     # --- Search API status ---
     has_serper = bool(
         st.session_state.get("serper_api_key")
@@ -367,7 +340,6 @@ def _render_input():
             )
 
         if date_range == "custom":
-            from datetime import datetime, timedelta
             dc1, dc2 = st.columns(2)
             with dc1:
                 custom_start = st.date_input(
@@ -386,11 +358,22 @@ def _render_input():
                 "before": custom_end.strftime("%Y-%m-%d"),
             }
 
-        adv1, adv2 = st.columns(2)
+        adv1, adv2, adv3 = st.columns(3)
         with adv1:
             max_urls = st.slider("Max URLs per platform", 5, 100, 15, step=5)
         with adv2:
             max_comments = st.slider("Max comments per URL", 50, 500, 200, step=50)
+        with adv3:
+            # One slot per platform is the most that can run at once (URLs
+            # within a platform stay sequential), so the range stops at 4
+            # and the default scrapes every selected platform in parallel
+            concurrency = st.slider(
+                "Platforms scraped at once", 1, 4, min(max(len(platforms), 1), 4),
+                help=(
+                    "Lower it to run fewer headless browsers at the same time "
+                    "on machines with little memory."
+                ),
+            )
 
         cookies_map = {}
         if "facebook" in platforms:
@@ -400,7 +383,6 @@ def _render_input():
                 key="onesearch_fb_cookies",
             )
             if fb_cookies:
-                from utils.common import load_cookies_as_list
                 content = fb_cookies.read().decode("utf-8")
                 cookies_map["facebook"] = load_cookies_as_list(content, "facebook.com")
 
@@ -411,7 +393,6 @@ def _render_input():
                 key="onesearch_ig_cookies",
             )
             if ig_cookies:
-                from utils.common import load_cookies_as_list
                 content = ig_cookies.read().decode("utf-8")
                 cookies_map["instagram"] = load_cookies_as_list(content, "instagram.com")
 
@@ -435,6 +416,7 @@ def _render_input():
             "date_range": date_range,
             "max_urls": max_urls,
             "max_comments": max_comments,
+            "concurrency": concurrency,
             "cookies_map": cookies_map,
             "queries": {p: [topic.strip()] for p in platforms},
             "relevance_keywords": [],
@@ -451,7 +433,6 @@ def _render_input():
                 from ai.notebooklm_bridge import NotebookLMBridge
                 if NotebookLMBridge.queries_remaining() > 0:
                     with st.spinner("Generating smart search queries..."):
-                        from search.pipeline import step_generate_queries_nlm
                         qr = run_async(step_generate_queries_nlm(
                             topic=topic.strip(),
                             platforms=platforms,
@@ -488,7 +469,6 @@ def _render_query_review():
     with btn_col1:
         if st.button("Generate with AI", key="gen_ai_queries", use_container_width=True):
             with st.spinner("Generating search queries with AI..."):
-                from search.pipeline import step_generate_queries
                 qr = run_async(step_generate_queries(
                     topic=wf["topic"],
                     platforms=wf["platforms"],
@@ -514,7 +494,6 @@ def _render_query_review():
                 else:
                     try:
                         with st.spinner("Getting smart suggestions from NotebookLM..."):
-                            from search.pipeline import step_generate_queries_nlm
                             qr = run_async(step_generate_queries_nlm(
                                 topic=wf["topic"],
                                 platforms=wf["platforms"],
@@ -530,14 +509,7 @@ def _render_query_review():
     for i, platform in enumerate(wf["platforms"]):
         with tabs[i]:
             current = wf["queries"].get(platform, [])
-            clean = [_strip_operators(q) for q in current]
-            # Deduplicate after stripping (operators may have been the only difference)
-            seen = set()
-            deduped = []
-            for q in clean:
-                if q and q not in seen:
-                    seen.add(q)
-                    deduped.append(q)
+            deduped = unique_clean_queries(tuple(current))
             text = st.text_area(
                 f"Queries for {platform.title()}",
                 value="\n".join(deduped),
@@ -552,18 +524,15 @@ def _render_query_review():
     # Action buttons
     col_back, col_approve = st.columns([1, 3])
     with col_back:
-        if st.button("Back", use_container_width=True):
-            wf["step"] = 0
-            st.rerun()
+        st.button("Back", use_container_width=True, on_click=_go_to_step, args=(0,))
     with col_approve:
         if st.button("Approve & Find Content", type="primary", use_container_width=True):
             # Restore Google operators for actual search
+            date_range = wf.get("date_range", "any")
             full_queries = {}
             for platform, clean_list in edited_clean_queries.items():
-                full_queries[platform] = [
-                    _restore_operators(q, platform, wf.get("date_range", "any"))
-                    for q in clean_list
-                ]
+                prefix, suffix = _operator_affixes(platform, date_range)
+                full_queries[platform] = [f"{prefix}{q}{suffix}" for q in clean_list]
             wf["queries"] = full_queries
 
             # Run URL search with live progress
@@ -583,15 +552,14 @@ def _render_query_review():
 
             progress_placeholder.info("Finding relevant content across platforms...")
 
-            from search.pipeline import step_search_urls
-            url_result = step_search_urls(
+            url_result = run_async(step_search_urls_async(
                 queries=full_queries,
                 platforms=wf["platforms"],
                 max_urls_per_platform=wf["max_urls"],
                 topic=wf["topic"],
                 relevance_keywords=wf.get("relevance_keywords"),
                 progress_callback=_search_progress,
-            )
+            ))
 
             progress_placeholder.empty()
             status_text.empty()
@@ -614,66 +582,136 @@ def _render_query_review():
 # Step 2: Review URLs
 # ═══════════════════════════════════════════════════════════════════════════
 
+@st.fragment
+def _render_url_tab(platform: str, df: pd.DataFrame):
+    """Render one platform's URL editor.
+
+    Its own fragment, so toggling a checkbox reruns only this tab rather
+    than the whole page. The action buttons read the edits from the
+    editor's widget state (see _url_selections_with_edits).
+    """
+    edited_df = st.data_editor(
+        df,
+        column_config={
+            "selected": st.column_config.CheckboxColumn("Select", default=True, width="small"),
+            "title": st.column_config.TextColumn("Title", width="large"),
+            "url": st.column_config.LinkColumn("URL", width="large"),
+        },
+        use_container_width=True,
+        hide_index=True,
+        key=f"url_editor_{platform}",
+        num_rows="fixed",
+    )
+
+    selected_count = int(edited_df["selected"].sum())
+    st.caption(f"{selected_count} of {len(df)} selected")
+
+
+def _url_selections_with_edits(wf: dict) -> dict:
+    """The stored URL selections with the editors' checkbox edits applied.
+
+    Edits are read from the data_editor widget states, so this also works
+    in a button callback, before the editors are drawn.
+    """
+    frames = wf["_url_frames"][1][0]
+    selections = {}
+    for platform in wf["platforms"]:
+        df = frames.get(platform)
+        if df is None:
+            selections[platform] = []
+            continue
+        records = df.to_dict("records")
+        editor = st.session_state.get(f"url_editor_{platform}") or {}
+        for row, changes in editor.get("edited_rows", {}).items():
+            records[int(row)].update(changes)
+        selections[platform] = records
+    return selections
+
+
+def _start_scrape():
+    """Scrape button callback: store the selection and move to step 3."""
+    wf = _get_wf()
+    selections = _url_selections_with_edits(wf)
+    wf["url_selections"] = selections
+
+    # Build url_map from selected URLs only; the url/title pairs are kept
+    # for the result metadata so step 3 doesn't re-filter
+    url_map = {}
+    url_map_detail = {}
+    for platform, items in selections.items():
+        selected = [
+            {"url": item["url"], "title": item["title"]}
+            for item in items if item.get("selected", True)
+        ]
+        url_map_detail[platform] = selected
+        if selected:
+            url_map[platform] = [item["url"] for item in selected]
+
+    if not url_map:
+        wf["_no_urls_selected"] = True
+        return
+
+    wf["url_map_for_scrape"] = url_map
+    wf["url_map_detail_for_result"] = url_map_detail
+    wf["step"] = 3
+
+
 def _render_url_review():
     """Render the URL review/selection step."""
     wf = _get_wf()
     url_selections = wf.get("url_selections", {})
 
-    # Summary counts
-    total_urls = sum(len(v) for v in url_selections.values())
-    total_selected = sum(
-        1 for v in url_selections.values() for item in v if item.get("selected", True)
-    )
+    # One editor frame per platform plus the URL total, reused for the tabs
+    # below. Edits live in the data_editor widgets until Search More or
+    # Scrape stores a new url_selections dict, so the frames are kept until then
+    cached = wf.get("_url_frames")
+    if cached is not None and cached[0] is url_selections:
+        frames, total_urls = cached[1]
+    else:
+        frames = {}
+        for platform in wf["platforms"]:
+            items = url_selections.get(platform, [])
+            if items:
+                df = pd.DataFrame(items)
+                # Ensure column order
+                if "selected" not in df.columns:
+                    df["selected"] = True
+                frames[platform] = df[["selected", "title", "url"]]
+        total_urls = sum(len(df) for df in frames.values())
+        wf["_url_frames"] = (url_selections, (frames, total_urls))
+
+    # Selection counts are shown per tab: each tab is a fragment, so a
+    # total here would not follow the checkbox edits
     st.markdown(
         f"#### Review Discovered URLs &nbsp; "
         f"<span style='color:#94A3B8;font-size:0.85rem'>"
-        f"{total_selected} of {total_urls} selected</span>",
+        f"{total_urls} found</span>",
         unsafe_allow_html=True,
     )
     st.caption("Deselect irrelevant URLs to avoid scraping wrong content.")
 
     # Per-platform tabs with data editors
     tabs = st.tabs([p.title() for p in wf["platforms"]])
-    updated_selections = {}
 
     for i, platform in enumerate(wf["platforms"]):
         with tabs[i]:
-            items = url_selections.get(platform, [])
-            if not items:
+            df = frames.get(platform)
+            if df is None:
                 st.info(f"No URLs found for {platform.title()}.")
-                updated_selections[platform] = []
                 continue
+            _render_url_tab(platform, df)
 
-            df = pd.DataFrame(items)
-            # Ensure column order
-            if "selected" not in df.columns:
-                df["selected"] = True
-            df = df[["selected", "title", "url"]]
-
-            edited_df = st.data_editor(
-                df,
-                column_config={
-                    "selected": st.column_config.CheckboxColumn("Select", default=True, width="small"),
-                    "title": st.column_config.TextColumn("Title", width="large"),
-                    "url": st.column_config.LinkColumn("URL", width="large"),
-                },
-                use_container_width=True,
-                hide_index=True,
-                key=f"url_editor_{platform}",
-                num_rows="fixed",
-            )
-
-            updated_selections[platform] = edited_df.to_dict("records")
-            selected_count = sum(1 for r in edited_df.to_dict("records") if r.get("selected"))
-            st.caption(f"{selected_count} of {len(items)} selected")
+    if wf.pop("_no_urls_selected", False):
+        st.warning("No URLs selected. Please select at least one URL.")
 
     # Action buttons
     col_back, col_more, col_scrape = st.columns([1, 1, 2])
 
     with col_back:
-        if st.button("Back to Queries", use_container_width=True):
-            wf["step"] = 1
-            st.rerun()
+        st.button(
+            "Back to Queries", use_container_width=True,
+            on_click=_go_to_step, args=(1,),
+        )
 
     with col_more:
         if st.button("Search More URLs", use_container_width=True):
@@ -692,77 +730,99 @@ def _render_url_review():
 
             progress_ph.info("Searching for more URLs...")
 
-            from search.pipeline import step_search_urls
-            url_result = step_search_urls(
+            url_result = run_async(step_search_urls_async(
                 queries=wf["queries"],
                 platforms=wf["platforms"],
                 max_urls_per_platform=wf["max_urls"] * 2,  # wider search
                 topic=wf["topic"],
                 relevance_keywords=wf.get("relevance_keywords"),
                 progress_callback=_more_progress,
-            )
+            ))
             progress_ph.empty()
             status_ph.empty()
 
             # Merge: keep existing selections, add new URLs as selected
+            updated_selections = _url_selections_with_edits(wf)
             for platform, new_details in url_result["url_map_detail"].items():
-                existing_urls = {
-                    item["url"] for item in updated_selections.get(platform, [])
-                }
-                current = list(updated_selections.get(platform, []))
-                for d in new_details:
-                    if d["url"] not in existing_urls:
-                        current.append({
-                            "url": d["url"], "title": d["title"], "selected": True,
-                        })
-                        existing_urls.add(d["url"])
-                updated_selections[platform] = current
+                items = updated_selections.setdefault(platform, [])
+                existing = {item["url"] for item in items}
+                # Keyed by URL, so repeats within the new batch collapse too
+                new_titles = {d["url"]: d["title"] for d in new_details}
+                items.extend(
+                    {"url": url, "title": title, "selected": True}
+                    for url, title in new_titles.items()
+                    if url not in existing
+                )
 
             wf["url_selections"] = updated_selections
             st.rerun()
 
     with col_scrape:
-        if st.button("Scrape Selected URLs", type="primary", use_container_width=True):
-            # Save current selections
-            wf["url_selections"] = updated_selections
-
-            # Build url_map from selected URLs only
-            url_map = {}
-            for platform, items in updated_selections.items():
-                selected_urls = [
-                    item["url"] for item in items if item.get("selected", True)
-                ]
-                if selected_urls:
-                    url_map[platform] = selected_urls
-
-            if not url_map:
-                st.warning("No URLs selected. Please select at least one URL.")
-                return
-
-            wf["url_map_for_scrape"] = url_map
-            wf["step"] = 3
-            st.rerun()
+        st.button(
+            "Scrape Selected URLs", type="primary", use_container_width=True,
+            on_click=_start_scrape,
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Step 3: Scraping (auto-runs, then advances to step 4)
 # ═══════════════════════════════════════════════════════════════════════════
 
+def _render_partial_scrape(partial: list[dict], topic: str):
+    """Show the per-URL results collected before a scrape failed."""
+    collected = [c for item in partial for c in item["comments"]]
+    if not collected:
+        return
+
+    st.warning(
+        f"Collected {len(collected)} comments from {len(partial)} URL(s) "
+        f"before the error."
+    )
+    st.dataframe(
+        pd.DataFrame(
+            [(item["platform"], item["url"], len(item["comments"])) for item in partial],
+            columns=["platform", "url", "comments"],
+        ),
+        column_config={"url": st.column_config.LinkColumn("URL", width="large")},
+        hide_index=True,
+        use_container_width=True,
+    )
+    # on_click="ignore": a rerun would restart the scrape on this step
+    st.download_button(
+        "Export collected comments (CSV)",
+        data=export_csv_bytes(collected),
+        file_name=f"one_search_{topic.replace(' ', '_')}_partial.csv",
+        mime="text/csv",
+        on_click="ignore",
+        key="dl_partial_csv",
+    )
+
+
 def _render_scraping():
     """Run scraping with progress, then auto-advance to results."""
     wf = _get_wf()
 
-    from utils.one_search_progress import OneSearchProgress
-
     progress_placeholder = st.empty()
     tracker = OneSearchProgress(progress_placeholder)
 
     url_map = wf.get("url_map_for_scrape", {})
 
-    try:
-        from search.pipeline import step_scrape_and_analyze
+    # Per-URL results land here as they finish, so a failed run can still
+    # show and export whatever was collected before the error
+    partial = []
+
+    async def _scrape_streaming():
+        queue = asyncio.Queue()
+
+        async def _consume():
+            collected = 0
+            while (item := await queue.get()) is not None:
+                partial.append(item)
+                collected += len(item["comments"])
+                # Counter only, so the scraper's per-URL message stays shown
+                tracker.set_comment_count(collected)
 
-        result = run_async(
+        result, _ = await asyncio.gather(
             step_scrape_and_analyze(
                 url_map=url_map,
                 platforms=wf["platforms"],
@@ -770,24 +830,35 @@ def _render_scraping():
                 max_comments_per_url=wf.get("max_comments", 200),
                 topic=wf["topic"],
                 progress_callback=tracker.on_message,
-            )
+                result_queue=queue,
+                concurrency=wf.get("concurrency", 4),
+            ),
+            _consume(),
         )
+        return result
+
+    try:
+        result = run_async(_scrape_streaming())
 
         tracker.complete(result.get("total_comments", 0))
 
         # Attach pipeline metadata to result
         result["queries"] = wf.get("queries", {})
+        url_map_detail = wf.get("url_map_detail_for_result", {})
         result["url_map_detail"] = {
-            platform: [
-                {"url": item["url"], "title": item["title"]}
-                for item in wf.get("url_selections", {}).get(platform, [])
-                if item.get("selected", True)
-            ]
+            platform: url_map_detail.get(platform, [])
             for platform in wf["platforms"]
         }
 
         wf["result"] = result
 
+        # Build the Results step's derived data in the background — it
+        # overlaps the NotebookLM analysis below (minutes of network waits)
+        # and the user's first look at the Overview tab
+        threading.Thread(
+            target=_prefetch_result_views, args=(result,), daemon=True,
+        ).start()
+
         # In NLM mode, run automated analysis before advancing to Results
         if _is_nlm_mode():
             _run_notebooklm_analysis(wf, result)
@@ -799,16 +870,80 @@ def _render_scraping():
         import traceback
         st.error(f"Scraping failed: {e}")
         st.code(traceback.format_exc(), language="text")
+        _render_partial_scrape(partial, wf.get("topic", ""))
         # Allow going back
-        if st.button("Back to URL Review"):
-            wf["step"] = 2
-            st.rerun()
+        st.button("Back to URL Review", on_click=_go_to_step, args=(2,))
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Step 4: Results
 # ═══════════════════════════════════════════════════════════════════════════
 
+def _build_url_frames(url_map_detail: dict) -> dict:
+    """Build the Content Sources table for each platform that has URLs.
+
+    Columns are Arrow-backed strings, which Streamlit ships to the browser
+    without an object-to-Arrow conversion.
+    """
+    return {
+        platform: pd.DataFrame(details, dtype="string[pyarrow]")
+        for platform, details in url_map_detail.items()
+        if details
+    }
+
+
+def _build_collection_log(scrape_log: list[dict]) -> dict | None:
+    """Summarize the scrape log for the Collection Log tab.
+
+    Returns the metric counts and the display table, or None when nothing
+    was scraped. Counters, off-topic sources and display rows come from a
+    single pass over the log.
+    """
+    if not scrape_log:
+        return None
+
+    ok_count = empty_count = total_comments = mismatched = 0
+    display_rows = []
+    for s in scrape_log:
+        status = s["status"]
+        comment_count = s["comment_count"]
+        is_match = s.get("content_match", True)
+        total_comments += comment_count
+        if status == "ok":
+            ok_count += 1
+            if not is_match:
+                mismatched += 1
+        elif status == "empty":
+            empty_count += 1
+        # Show content titles, not raw URLs/internals
+        display_rows.append({
+            "platform": s["platform"],
+            "content": s.get("content_title", "") or s.get("title", ""),
+            "comments": comment_count,
+            "status": "OK" if is_match else "Off-topic",
+        })
+
+    # Schema is fixed — skip dtype inference; categoricals keep the
+    # repeated platform/status strings small when serialized, and the
+    # Arrow-backed titles serialize without an object-column conversion
+    df = pd.DataFrame.from_records(
+        display_rows, columns=["platform", "content", "comments", "status"],
+    ).astype({
+        "platform": "category",
+        "content": "string[pyarrow]",
+        "comments": "int32",
+        "status": "category",
+    })
+
+    return {
+        "ok_count": ok_count,
+        "empty_count": empty_count,
+        "total_comments": total_comments,
+        "mismatched": mismatched,
+        "df": df,
+    }
+
+
 def _render_pipeline_details(result: dict):
     """Render an expandable panel showing collection details."""
     with st.expander("Collection Details", expanded=False):
@@ -818,82 +953,58 @@ def _render_pipeline_details(result: dict):
             queries = result.get("queries", {})
             if queries:
                 for platform, q_list in queries.items():
-                    clean_list = [_strip_operators(q) for q in q_list]
-                    # Deduplicate after stripping
-                    seen_q = set()
-                    unique = [q for q in clean_list if q and q not in seen_q and not seen_q.add(q)]
-                    st.markdown(f"**{platform.title()}** ({len(unique)} search terms)")
-                    for q in unique:
-                        st.markdown(f"- {q}")
+                    unique = unique_clean_queries(tuple(q_list))
+                    # Heading and terms as one markdown element
+                    st.markdown("\n".join(
+                        [f"**{platform.title()}** ({len(unique)} search terms)"]
+                        + [f"- {q}" for q in unique]
+                    ))
             else:
                 st.info("No search terms available.")
 
         with tab2:
-            url_map_detail = result.get("url_map_detail", {})
-            if url_map_detail:
-                for platform, details in url_map_detail.items():
-                    if details:
-                        st.markdown(f"**{platform.title()}** ({len(details)} URLs)")
-                        df_urls = pd.DataFrame(details)
-                        st.dataframe(
-                            df_urls,
-                            column_config={
-                                "url": st.column_config.LinkColumn("URL", width="large"),
-                                "title": st.column_config.TextColumn("Title", width="large"),
-                            },
-                            use_container_width=True,
-                            hide_index=True,
-                        )
+            url_frames = _result_memo(
+                result, "url_frames",
+                lambda: _build_url_frames(result.get("url_map_detail", {})),
+            )
+            if url_frames:
+                for platform, df_urls in url_frames.items():
+                    st.markdown(f"**{platform.title()}** ({len(df_urls)} URLs)")
+                    st.dataframe(
+                        df_urls,
+                        column_config={
+                            "url": st.column_config.LinkColumn("URL", width="large"),
+                            "title": st.column_config.TextColumn("Title", width="large"),
+                        },
+                        use_container_width=True,
+                        hide_index=True,
+                    )
             else:
                 st.info("No URL detail data available.")
 
         with tab3:
-            scrape_log = result.get("scrape_log", [])
-            if scrape_log:
-                ok_count = sum(1 for s in scrape_log if s["status"] == "ok")
-                empty_count = sum(1 for s in scrape_log if s["status"] == "empty")
-                total_scraped_comments = sum(s["comment_count"] for s in scrape_log)
-                suspect_count = sum(
-                    1 for s in scrape_log
-                    if not s.get("content_match", True) and s["status"] == "ok"
-                )
-
+            log = _result_memo(
+                result, "collection_log",
+                lambda: _build_collection_log(result.get("scrape_log", [])),
+            )
+            if log:
                 m1, m2, m3, m4 = st.columns(4)
-                m1.metric("Sources with comments", ok_count)
-                m2.metric("Empty sources", empty_count)
-                m3.metric("Total comments", total_scraped_comments)
-                if suspect_count > 0:
-                    m4.metric("Off-topic sources", suspect_count)
-                else:
-                    m4.metric("Off-topic sources", 0)
+                m1.metric("Sources with comments", log["ok_count"])
+                m2.metric("Empty sources", log["empty_count"])
+                m3.metric("Total comments", log["total_comments"])
+                m4.metric("Off-topic sources", log["mismatched"])
 
                 # Warning banner for mismatched content
                 topic = result.get("topic", "") or _get_wf().get("topic", "")
-                mismatched = [
-                    s for s in scrape_log
-                    if not s.get("content_match", True) and s["status"] == "ok"
-                ]
-                if mismatched:
+                if log["mismatched"]:
                     st.warning(
-                        f"**{len(mismatched)} source(s) may contain off-topic content** "
+                        f"**{log['mismatched']} source(s) may contain off-topic content** "
                         f"(not matching \"{topic}\"). "
                         f"Some comments may be unrelated."
                     )
 
-                # Build display dataframe — show content titles, not raw URLs/internals
-                display_rows = []
-                for s in scrape_log:
-                    is_match = s.get("content_match", True)
-                    display_rows.append({
-                        "platform": s["platform"],
-                        "content": s.get("content_title", "") or s.get("title", ""),
-                        "comments": s["comment_count"],
-                        "status": "OK" if is_match else "Off-topic",
-                    })
-                df_log = pd.DataFrame(display_rows)
-
                 st.dataframe(
-                    df_log,
+                    log["df"],
                     column_config={
                         "platform": st.column_config.TextColumn("Platform", width="small"),
                         "content": st.column_config.TextColumn("Content", width="large"),
@@ -907,22 +1018,58 @@ def _render_pipeline_details(result: dict):
                 st.info("No collection data available.")
 
 
+@st.cache_data(show_spinner=False)
+def _build_insight_html(insight_json: str) -> dict:
+    """Pre-render the HTML fragments of an insight report.
+
+    Keyed on the report's JSON, so reruns reuse the fragments until the
+    report is regenerated.
+    """
+    insight = json.loads(insight_json)
+    fragments = {"summary": "", "overall": "", "recs": []}
+
+    summary = insight.get("executive_summary", "")
+    if summary:
+        fragments["summary"] = f'<div class="osinsight-summary">{summary}</div>'
+
+    sentiment = insight.get("sentiment_overview", {})
+    if sentiment and isinstance(sentiment, dict):
+        overall = sentiment.get("overall", "unknown")
+        sentiment_colors = {
+            "positive": "#34D399", "negative": "#F87171",
+            "neutral": "#94A3B8", "mixed": "#FBBF24",
+        }
+        color = sentiment_colors.get(overall, "#94A3B8")
+        fragments["overall"] = (
+            f"Overall: <span style='color:{color};font-weight:600'>"
+            f"{overall.upper()}</span>"
+        )
+
+    p_colors = {"high": "#F87171", "medium": "#FBBF24", "low": "#34D399"}
+    for r in insight.get("actionable_recommendations", []):
+        if isinstance(r, dict):
+            priority = r.get("priority", "medium")
+            p_color = p_colors.get(priority, "#94A3B8")
+            fragments["recs"].append(
+                f"<span style='color:{p_color};font-weight:600'>"
+                f"[{priority.upper()}]</span> {r.get('recommendation', '')}"
+            )
+
+    return fragments
+
+
 def _render_customer_insight(insight: dict, topic: str):
     """Render the AI Customer Insight Report."""
     if not isinstance(insight, dict):
         return
 
+    fragments = _build_insight_html(json.dumps(insight, sort_keys=True, default=str))
+
     st.markdown("### AI Customer Insight Report")
 
     # Executive Summary
-    summary = insight.get("executive_summary", "")
-    if summary:
-        st.markdown(
-            f'<div style="background:rgba(99,102,241,0.06);border-left:3px solid '
-            f'rgba(99,102,241,0.4);padding:1rem 1.2rem;border-radius:0 8px 8px 0;'
-            f'margin-bottom:1rem;font-size:0.92rem;line-height:1.6">{summary}</div>',
-            unsafe_allow_html=True,
-        )
+    if fragments["summary"]:
+        st.markdown(fragments["summary"], unsafe_allow_html=True)
 
     # Key Findings
     findings = insight.get("key_findings", [])
@@ -943,17 +1090,7 @@ def _render_customer_insight(insight: dict, topic: str):
     sentiment = insight.get("sentiment_overview", {})
     if sentiment and isinstance(sentiment, dict):
         with st.expander("Sentiment Overview", expanded=True):
-            overall = sentiment.get("overall", "unknown")
-            sentiment_colors = {
-                "positive": "#34D399", "negative": "#F87171",
-                "neutral": "#94A3B8", "mixed": "#FBBF24",
-            }
-            color = sentiment_colors.get(overall, "#94A3B8")
-            st.markdown(
-                f"Overall: <span style='color:{color};font-weight:600'>"
-                f"{overall.upper()}</span>",
-                unsafe_allow_html=True,
-            )
+            st.markdown(fragments["overall"], unsafe_allow_html=True)
 
             sc1, sc2, sc3 = st.columns(3)
             sc1.metric("Positive", f"{sentiment.get('positive_percentage', 0)}%")
@@ -962,9 +1099,9 @@ def _render_customer_insight(insight: dict, topic: str):
 
             drivers = sentiment.get("sentiment_drivers", [])
             if drivers:
-                st.markdown("**Sentiment Drivers:**")
-                for d in drivers:
-                    st.markdown(f"- {d}")
+                st.markdown("\n".join(
+                    ["**Sentiment Drivers:**"] + [f"- {d}" for d in drivers]
+                ))
 
     # Audience Profile
     audience = insight.get("audience_profile", {})
@@ -996,18 +1133,11 @@ def _render_customer_insight(insight: dict, topic: str):
     recs = insight.get("actionable_recommendations", [])
     if recs:
         with st.expander("Actionable Recommendations", expanded=True):
-            for r in recs:
-                if isinstance(r, dict):
-                    priority = r.get("priority", "medium")
-                    p_colors = {"high": "#F87171", "medium": "#FBBF24", "low": "#34D399"}
-                    p_color = p_colors.get(priority, "#94A3B8")
-                    st.markdown(
-                        f"<span style='color:{p_color};font-weight:600'>"
-                        f"[{priority.upper()}]</span> {r.get('recommendation', '')}",
-                        unsafe_allow_html=True,
-                    )
-                    if r.get("rationale"):
-                        st.caption(r["rationale"])
+            rec_dicts = [r for r in recs if isinstance(r, dict)]
+            for r, rec_html in zip(rec_dicts, fragments["recs"]):
+                st.markdown(rec_html, unsafe_allow_html=True)
+                if r.get("rationale"):
+                    st.caption(r["rationale"])
 
     # Opportunities & Risks side by side
     opportunities = insight.get("opportunities", [])
@@ -1036,26 +1166,42 @@ def _render_customer_insight(insight: dict, topic: str):
 def _render_cross_platform(result: dict):
     """Render cross-platform comparison if 2+ platforms have data."""
     try:
-        from utils.analysis_ui import render_platform_comparison
-        render_platform_comparison(result)
+        comparison = _result_memo(
+            result, "platform_comparison",
+            lambda: compose_platform_comparison(result.get("comments_clean", [])),
+        )
+        render_platform_comparison(comparison)
     except Exception:
         pass
 
 
-def _render_aspect_heatmap(result: dict):
-    """Render aspect-based sentiment heatmap from AI tags."""
-    tag_summary = result.get("tag_summary")
-    if not tag_summary:
-        return
+# Drill-down card class per aspect sentiment (see .osdrill in style.css);
+# anything else keeps the neutral border
+_DRILL_CLASS = {
+    "positive": "osdrill osdrill-positive", "negative": "osdrill osdrill-negative",
+}
 
-    aspect_sentiment = tag_summary.get("aspect_sentiment", {})
-    if not aspect_sentiment:
-        return
 
-    st.markdown("### Aspect-Based Sentiment")
-    st.caption("What people specifically like and dislike — auto-discovered from comments.")
+def _build_aspect_index(comments: list[dict]) -> dict[str, list[tuple[dict, str]]]:
+    """Map each lowercased aspect to its (comment, aspect sentiment) pairs.
+
+    A comment is listed once per aspect, under its first mention, in
+    comment order.
+    """
+    index = {}
+    for c in comments:
+        seen = set()
+        for asp in c.get("ai_aspects", ()):
+            name = asp.get("aspect", "").lower()
+            if name in seen:
+                continue
+            seen.add(name)
+            index.setdefault(name, []).append((c, asp.get("sentiment", "neutral")))
+    return index
+
 
-    # Build heatmap data
+def _aspect_table(aspect_sentiment: dict) -> pd.DataFrame | None:
+    """Top 15 aspects by mentions with their sentiment counts (None if empty)."""
     rows = []
     for aspect, counts in aspect_sentiment.items():
         pos = counts.get("positive", 0)
@@ -1063,206 +1209,423 @@ def _render_aspect_heatmap(result: dict):
         neg = counts.get("negative", 0)
         total = pos + neu + neg
         if total > 0:
-            rows.append({
-                "Aspect": aspect.title(),
-                "Positive": pos,
-                "Neutral": neu,
-                "Negative": neg,
-                "Total": total,
-            })
-
-    if not rows:
+            rows.append((total, aspect, pos, neu, neg))
+
+    # Partial selection instead of a full sort; ties keep dict order like sort()
+    top = heapq.nlargest(15, rows, key=itemgetter(0))
+    if not top:
+        return None
+
+    return pd.DataFrame(
+        [(aspect.title(), pos, neu, neg, total) for total, aspect, pos, neu, neg in top],
+        columns=["Aspect", "Positive", "Neutral", "Negative", "Total"],
+    )
+
+
+@st.fragment
+def _render_aspect_heatmap(result: dict):
+    """Render aspect-based sentiment heatmap from AI tags.
+
+    A fragment, so picking a drill-down aspect reruns only this section.
+    """
+    tag_summary = result.get("tag_summary")
+    if not tag_summary:
         return
 
-    # Sort by total mentions descending
-    rows.sort(key=lambda r: r["Total"], reverse=True)
-    # Limit to top 15 aspects
-    rows = rows[:15]
+    aspect_sentiment = tag_summary.get("aspect_sentiment", {})
+    if not aspect_sentiment:
+        return
 
-    df = pd.DataFrame(rows)
+    st.markdown("### Aspect-Based Sentiment")
+    st.caption("What people specifically like and dislike — auto-discovered from comments.")
 
-    # Render as colored table
-    col_map = {
-        "Positive": "#34D399",
-        "Neutral": "#94A3B8",
-        "Negative": "#F87171",
-    }
+    df = _result_memo(result, "aspect_table", lambda: _aspect_table(aspect_sentiment))
+    if df is None:
+        return
 
-    # Build HTML table
-    html = '<table style="width:100%;border-collapse:collapse;font-size:0.85rem">'
-    html += '<tr style="border-bottom:2px solid rgba(255,255,255,0.1)">'
-    for col in ["Aspect", "Positive", "Neutral", "Negative", "Total"]:
-        html += f'<th style="text-align:left;padding:8px 12px;color:#94A3B8">{col}</th>'
-    html += '</tr>'
-
-    max_count = max(r["Total"] for r in rows) if rows else 1
-    for row in rows:
-        html += '<tr style="border-bottom:1px solid rgba(255,255,255,0.05)">'
-        html += f'<td style="padding:8px 12px;font-weight:600">{row["Aspect"]}</td>'
-        for sent in ["Positive", "Neutral", "Negative"]:
-            val = row[sent]
-            color = col_map[sent]
-            # Bar width proportional to count
-            bar_width = int(val / max_count * 100) if max_count > 0 else 0
-            html += (
-                f'<td style="padding:8px 12px">'
-                f'<div style="display:flex;align-items:center;gap:6px">'
-                f'<div style="background:{color};height:8px;width:{bar_width}%;'
-                f'border-radius:4px;min-width:2px;opacity:0.7"></div>'
-                f'<span style="color:{color};font-size:0.8rem">{val}</span>'
-                f'</div></td>'
+    # Native grid with per-sentiment coloured bars, all scaled to the largest
+    # aspect total. st.dataframe doesn't draw Styler.bar, so the bars are
+    # ProgressColumns. Rows are sorted by Total, so the first one is the largest
+    max_count = int(df["Total"].iat[0])
+    st.dataframe(
+        df,
+        column_config={
+            col: st.column_config.ProgressColumn(
+                min_value=0, max_value=max_count, format="%d", color=color,
             )
-        html += f'<td style="padding:8px 12px;color:#64748B">{row["Total"]}</td>'
-        html += '</tr>'
-    html += '</table>'
-
-    st.markdown(html, unsafe_allow_html=True)
+            for col, color in (
+                ("Positive", "#34D399"), ("Neutral", "#94A3B8"), ("Negative", "#F87171"),
+            )
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
 
     # Clickable aspect drill-down
     comments = result.get("comments_clean", [])
     if comments:
-        aspect_names = [r["Aspect"].lower() for r in rows]
         selected_aspect = st.selectbox(
             "Drill into aspect",
-            ["(select an aspect)"] + [r["Aspect"] for r in rows],
+            ["(select an aspect)"] + df["Aspect"].tolist(),
             key="aspect_drill",
         )
         if selected_aspect and selected_aspect != "(select an aspect)":
-            aspect_lower = selected_aspect.lower()
-            matching = []
-            for c in comments:
-                for asp in c.get("ai_aspects", []):
-                    if asp.get("aspect", "").lower() == aspect_lower:
-                        matching.append({
-                            "text": c.get("text", ""),
-                            "platform": c.get("platform", ""),
-                            "aspect_sentiment": asp.get("sentiment", "neutral"),
-                            "likes": c.get("likes", 0),
-                        })
-                        break
+            aspect_index = _result_memo(
+                result, "aspect_index", lambda: _build_aspect_index(comments),
+            )
+            matching = aspect_index.get(selected_aspect.lower(), ())
             if matching:
                 st.markdown(f"**{len(matching)} comments about {selected_aspect}:**")
-                for m in matching[:20]:
-                    sent_color = {
-                        "positive": "#34D399", "negative": "#F87171", "neutral": "#94A3B8",
-                    }.get(m["aspect_sentiment"], "#94A3B8")
-                    st.markdown(
-                        f'<div style="border-left:3px solid {sent_color};padding:4px 12px;'
-                        f'margin:4px 0;font-size:0.85rem">{m["text"][:300]}'
-                        f'<span style="color:#64748B;font-size:0.75rem"> — {m["platform"].title()}'
-                        f' | {m["likes"]} likes</span></div>',
-                        unsafe_allow_html=True,
+                # One markdown element for all cards instead of one per comment
+                cards = []
+                drill_class = _DRILL_CLASS.get
+                for c, aspect_sentiment in matching[:20]:
+                    cards.append(
+                        f'<div class="{drill_class(aspect_sentiment, "osdrill")}">'
+                        f'{c.get("text", "")[:300]}<span class="osdrill-meta"> — '
+                        f'{c.get("platform", "").title()} | {c.get("likes", 0)} likes</span></div>'
                     )
+                st.markdown("".join(cards), unsafe_allow_html=True)
+
+
+def _result_memo(result: dict, key: str, build):
+    """Memoize a value derived from a search result across reruns.
+
+    The result dict lives in session_state for the whole search and its
+    comments don't change, so derived values are stored on it and dropped
+    with it on New Search. (st.cache_data is shared by every session, so
+    keying it on id(comments) could serve another user's search.)
+
+    The prefetch thread and the download callbacks share the memo with the
+    page, so access is locked. The lock lives on the result (a page-level
+    one would be replaced on every rerun); builds run outside it and the
+    first stored value wins.
+    """
+    lock = result.setdefault("_memo_lock", threading.Lock())
+    with lock:
+        memo = result.setdefault("_memo", {})
+        if key in memo:
+            return memo[key]
+    value = build()
+    with lock:
+        return memo.setdefault(key, value)
+
+
+def _scan_tag_flags(comments: list[dict]) -> tuple[bool, bool]:
+    """Return (has_tags, has_full_tags) in one pass, stopping once both are set."""
+    has_tags = has_full_tags = False
+    for c in comments:
+        if not has_tags and c.get("ai_sentiment"):
+            has_tags = True
+        if not has_full_tags and c.get("ai_intent"):
+            has_full_tags = True
+        if has_tags and has_full_tags:
+            break
+    return has_tags, has_full_tags
+
+
+def _filter_options(comments: list[dict]) -> tuple[list[str], list[str]]:
+    """Return the sorted platform and intent values in one pass."""
+    platforms = set()
+    intents = set()
+    for c in comments:
+        platforms.add(c.get("platform", "unknown"))
+        intents.add(c.get("ai_intent", "other"))
+    return sorted(platforms), sorted(intents)
+
+
+def _explorer_frame(comments: list[dict]) -> pd.DataFrame:
+    """Platform, sentiment and intent per comment for the explorer filters.
+
+    Categorical columns, so each filter is one vectorized isin() instead of
+    a dict lookup per comment. Row i is comments[i] (RangeIndex).
+    """
+    return pd.DataFrame({
+        "platform": [c.get("platform", "unknown") for c in comments],
+        "sentiment": [c.get("ai_sentiment", "neutral") for c in comments],
+        "intent": [c.get("ai_intent", "other") for c in comments],
+    }).astype("category")
+
+
+def _search_haystacks(comments: list[dict]) -> list[str]:
+    """Lowercased text and title per comment (newline-joined) for search.
+
+    The search box is a single-line input, so a query can never match
+    across the newline joining the two fields.
+    """
+    return [
+        f'{c.get("text", "")}\n{c.get("content_title", "")}'.lower()
+        for c in comments
+    ]
+
+
+def _prefetch_result_views(result: dict):
+    """Warm the result memo for the Results step from a background thread.
+
+    Covers the comment-derived values that are otherwise built on the
+    first Results render or the first explorer search / aspect drill-down.
+    Builders are pure, so a race with the page building the same entry
+    only costs a duplicate build. Export bytes are left out: they are only
+    built when a download is clicked.
+    """
+    comments = result.get("comments_clean", [])
+    if not comments:
+        return
+    _result_memo(result, "tag_flags", lambda: _scan_tag_flags(comments))
+    _result_memo(result, "filter_options", lambda: _filter_options(comments))
+    _result_memo(result, "explorer_frame", lambda: _explorer_frame(comments))
+    _result_memo(result, "search_haystacks", lambda: _search_haystacks(comments))
+    _result_memo(result, "aspect_index", lambda: _build_aspect_index(comments))
+    _result_memo(
+        result, "platform_comparison", lambda: compose_platform_comparison(comments),
+    )
+
+
+def _filter_comments(
+    result: dict,
+    platform_set: set | None,
+    sentiment_set: set | None,
+    intent_set: set | None,
+    search_lower: str | None,
+) -> list[dict]:
+    """Return the comments matching the explorer filters, in original order.
+
+    Tag filters are boolean masks over categorical columns built once per
+    search; the substring search then only scans the rows they keep.
+    """
+    comments = result["comments_clean"]
+    frame = _result_memo(result, "explorer_frame", lambda: _explorer_frame(comments))
+    mask = None
+    for column, selected in (
+        ("platform", platform_set), ("sentiment", sentiment_set), ("intent", intent_set),
+    ):
+        if selected is not None:
+            col_mask = frame[column].isin(selected)
+            mask = col_mask if mask is None else mask & col_mask
+    rows = range(len(comments)) if mask is None else frame.index[mask].tolist()
+
+    if search_lower is None:
+        return [comments[i] for i in rows]
+    # Lowercased text + title per comment, built on the first search and
+    # kept for the rest of the search (comments themselves stay untouched
+    # so exports don't pick up helper fields)
+    haystacks = _result_memo(
+        result, "search_haystacks", lambda: _search_haystacks(comments),
+    )
+    return [comments[i] for i in rows if search_lower in haystacks[i]]
+
+
+def _explorer_stats(filtered: list[dict], total_all: int, has_tags: bool) -> str:
+    """Build the explorer's quick stats line for the filtered comments."""
+    total_shown = len(filtered)
+    stats_parts = [f"Showing **{total_shown:,}** of {total_all:,} comments"]
+    if has_tags and filtered:
+        # Sentiment and aspect tallies in one pass over the filtered comments
+        sent_counts = {}
+        aspect_counts = {}
+        for c in filtered:
+            sent = c.get("ai_sentiment", "neutral")
+            sent_counts[sent] = sent_counts.get(sent, 0) + 1
+            for a in c.get("ai_aspects", ()):
+                name = a.get("aspect", "")
+                if name:
+                    aspect_counts[name] = aspect_counts.get(name, 0) + 1
+
+        top_sent = max(sent_counts.items(), key=itemgetter(1))
+        pct = round(top_sent[1] / total_shown * 100)
+        stats_parts.append(f"{pct}% {top_sent[0]}")
+
+        # Top aspect
+        if aspect_counts:
+            top_aspect = max(aspect_counts.items(), key=itemgetter(1))[0]
+            stats_parts.append(f"Top aspect: {top_aspect}")
+
+    return " | ".join(stats_parts)
+
+
+# Sentiment → CSS class suffix (unknown labels render as neutral)
+_SENT_CLASS = {
+    "positive": "positive", "negative": "negative",
+    "neutral": "neutral", "mixed": "mixed",
+}
+
+# Sentiment sort order: most negative first
+_SENT_ORDER = {"negative": 0, "mixed": 1, "neutral": 2, "positive": 3}
+
+
+def _sentiment_rank(comment: dict) -> int:
+    """Sort key for the explorer's sentiment order."""
+    return _SENT_ORDER.get(comment.get("ai_sentiment", "neutral"), 2)
+
+
+def _sorted_by_sentiment(comments: list[dict]) -> list[dict]:
+    """Stable sentiment-order sort as an O(N) bucket pass (4 ranks)."""
+    buckets = ([], [], [], [])
+    for c in comments:
+        buckets[_sentiment_rank(c)].append(c)
+    return [c for bucket in buckets for c in bucket]
+
+
+def _comment_card_html(c: dict, has_tags: bool, has_full_tags: bool) -> str:
+    """Build the HTML for one explorer comment card."""
+    text = c.get("text", "")[:500]
+    platform = c.get("platform", "unknown")
+    username = c.get("username", "Anonymous")
+    likes = c.get("likes", 0)
+    date = c.get("date", "")
+    content_title = c.get("content_title", "")
+
+    # Card pieces are collected and joined once at the end
+    parts = [
+        '<div class="osc-card"><div class="osc-badges">'
+        f'<span class="osc-badge osc-platform">{platform.title()}</span>'
+    ]
+
+    if has_tags:
+        sent_class = _SENT_CLASS.get
+        sentiment = c.get("ai_sentiment", "neutral")
+        s_cls = sent_class(sentiment, "neutral")
+        parts.append(f'<span class="osc-badge osc-sent-{s_cls}">{sentiment}</span>')
+
+        # Intent and aspect badges only when full LLM tags are available
+        if has_full_tags:
+            intent = c.get("ai_intent", "other")
+            parts.append(
+                f'<span class="osc-badge osc-intent">{intent.replace("_", " ")}</span>'
+            )
+
+            # Aspect chips
+            for asp in c.get("ai_aspects", [])[:3]:
+                a_name = asp.get("aspect", "")
+                a_cls = sent_class(asp.get("sentiment", "neutral"), "neutral")
+                parts.append(
+                    f'<span class="osc-badge osc-aspect osc-asp-{a_cls}">{a_name}</span>'
+                )
 
+    parts.append('</div>')
 
+    if content_title:
+        t = content_title[:120] + ("..." if len(content_title) > 120 else "")
+        parts.append(f'<div class="osc-title">Re: {t}</div>')
+
+    parts.append(
+        f'<div class="osc-text">{text}</div>'
+        f'<div class="osc-meta">@{username} | {likes} likes | {date}</div>'
+        '</div>'
+    )
+    return "".join(parts)
+
+
+@st.fragment
 def _render_comment_explorer(result: dict, wf: dict):
-    """Render the smart comment explorer with filters and search."""
+    """Render the smart comment explorer with filters and search.
+
+    A fragment, so applying filters or paging reruns only the explorer
+    instead of every tab on the results page.
+    """
     comments = result.get("comments_clean", [])
     if not comments:
         return
 
     st.markdown("### Comment Explorer")
 
-    has_tags = any(c.get("ai_sentiment") for c in comments)
     # Full AI tags include intent and aspects (from LLM tagger, not VADER)
-    has_full_tags = any(c.get("ai_intent") for c in comments)
-
-    # Filter controls
-    filter_cols = st.columns([1, 1, 1, 1, 2])
-
-    with filter_cols[0]:
-        all_platforms = sorted(set(c.get("platform", "unknown") for c in comments))
-        sel_platforms = st.multiselect(
-            "Platform", all_platforms,
-            default=all_platforms,
-            format_func=str.title,
-            key="exp_platform",
-        )
+    has_tags, has_full_tags = _result_memo(
+        result, "tag_flags", lambda: _scan_tag_flags(comments),
+    )
+    all_platforms, all_intents = _result_memo(
+        result, "filter_options", lambda: _filter_options(comments),
+    )
+
+    # Filter controls — grouped in a form so changing several filters (or
+    # typing a search) costs one rerun on Apply instead of one per widget
+    with st.form("exp_filters"):
+        filter_cols = st.columns([1, 1, 1, 1, 2])
 
-    with filter_cols[1]:
-        if has_tags:
-            sentiments = ["positive", "negative", "neutral", "mixed"]
-            sel_sentiments = st.multiselect(
-                "Sentiment", sentiments,
-                default=sentiments,
+        with filter_cols[0]:
+            sel_platforms = st.multiselect(
+                "Platform", all_platforms,
+                default=all_platforms,
                 format_func=str.title,
-                key="exp_sentiment",
+                key="exp_platform",
             )
-        else:
-            sel_sentiments = None
 
-    with filter_cols[2]:
-        # Only show intent filter when full LLM tags are available (not VADER-only)
-        if has_full_tags:
-            all_intents = sorted(set(c.get("ai_intent", "other") for c in comments))
-            sel_intents = st.multiselect(
-                "Intent", all_intents,
-                default=all_intents,
-                format_func=lambda x: x.replace("_", " ").title(),
-                key="exp_intent",
+        with filter_cols[1]:
+            if has_tags:
+                sentiments = ["positive", "negative", "neutral", "mixed"]
+                sel_sentiments = st.multiselect(
+                    "Sentiment", sentiments,
+                    default=sentiments,
+                    format_func=str.title,
+                    key="exp_sentiment",
+                )
+            else:
+                sel_sentiments = None
+
+        with filter_cols[2]:
+            # Only show intent filter when full LLM tags are available (not VADER-only)
+            if has_full_tags:
+                sel_intents = st.multiselect(
+                    "Intent", all_intents,
+                    default=all_intents,
+                    format_func=lambda x: x.replace("_", " ").title(),
+                    key="exp_intent",
+                )
+            else:
+                sel_intents = None
+
+        with filter_cols[3]:
+            sort_by = st.selectbox(
+                "Sort by",
+                ["likes", "date", "sentiment"],
+                format_func=lambda x: x.title(),
+                key="exp_sort",
             )
-        else:
-            sel_intents = None
-
-    with filter_cols[3]:
-        sort_by = st.selectbox(
-            "Sort by",
-            ["likes", "date", "sentiment"],
-            format_func=lambda x: x.title(),
-            key="exp_sort",
-        )
 
-    with filter_cols[4]:
-        search_text = st.text_input(
-            "Search comments",
-            placeholder="Type to search...",
-            key="exp_search",
-        )
+        with filter_cols[4]:
+            search_text = st.text_input(
+                "Search comments",
+                placeholder="Type to search...",
+                key="exp_search",
+            )
 
-    # Apply filters
-    filtered = comments
-    if sel_platforms:
-        filtered = [c for c in filtered if c.get("platform", "unknown") in sel_platforms]
-    if sel_sentiments and has_tags:
-        filtered = [c for c in filtered if c.get("ai_sentiment", "neutral") in sel_sentiments]
-    if sel_intents and has_tags:
-        filtered = [c for c in filtered if c.get("ai_intent", "other") in sel_intents]
-    if search_text:
-        search_lower = search_text.lower()
-        filtered = [c for c in filtered
-            if search_lower in c.get("text", "").lower()
-            or search_lower in c.get("content_title", "").lower()]
-
-    # Sort
-    if sort_by == "likes":
-        filtered.sort(key=lambda c: c.get("likes", 0), reverse=True)
-    elif sort_by == "date":
-        filtered.sort(key=lambda c: c.get("date", ""), reverse=True)
-    elif sort_by == "sentiment" and has_tags:
-        sent_order = {"negative": 0, "mixed": 1, "neutral": 2, "positive": 3}
-        filtered.sort(key=lambda c: sent_order.get(c.get("ai_sentiment", "neutral"), 2))
+        st.form_submit_button("Apply filters")
 
-    # Quick stats bar
-    total_all = len(comments)
+    # Apply all filters in one pass (an empty selection means "no filter")
+    platform_set = set(sel_platforms) if sel_platforms else None
+    sentiment_set = set(sel_sentiments) if sel_sentiments and has_tags else None
+    intent_set = set(sel_intents) if sel_intents and has_tags else None
+    search_lower = search_text.lower() if search_text else None
+
+    # Filtering and the stats bar depend only on the filters, so paging or
+    # re-sorting the same filter set reuses the last result
+    filter_state = (
+        tuple(sel_platforms or ()), tuple(sel_sentiments or ()),
+        tuple(sel_intents or ()), search_text,
+    )
+    memo = result.setdefault("_memo", {})
+    cached = memo.get("explorer_filtered")
+    if cached is None or cached[0] != filter_state:
+        filtered = _filter_comments(
+            result, platform_set, sentiment_set, intent_set, search_lower,
+        )
+        cached = memo["explorer_filtered"] = (
+            filter_state, filtered, _explorer_stats(filtered, len(comments), has_tags),
+        )
+    _, filtered, stats_line = cached
     total_shown = len(filtered)
-    stats_parts = [f"Showing **{total_shown:,}** of {total_all:,} comments"]
-    if has_tags and filtered:
-        from collections import Counter
-        sent_counts = Counter(c.get("ai_sentiment", "neutral") for c in filtered)
-        top_sent = sent_counts.most_common(1)[0] if sent_counts else ("neutral", 0)
-        pct = round(top_sent[1] / total_shown * 100) if total_shown else 0
-        stats_parts.append(f"{pct}% {top_sent[0]}")
 
-        # Top aspect
-        aspect_counts = Counter()
-        for c in filtered:
-            for a in c.get("ai_aspects", []):
-                aspect_counts[a.get("aspect", "")] += 1
-        if aspect_counts:
-            top_aspect = aspect_counts.most_common(1)[0][0]
-            stats_parts.append(f"Top aspect: {top_aspect}")
+    # Quick stats bar
+    st.markdown(stats_line)
 
-    st.markdown(" | ".join(stats_parts))
+    # Sort key — normalized comments always carry "likes" and "date" (see
+    # utils.schema.CLEAN_FIELDS), so a C-level itemgetter can replace the lambdas
+    if sort_by in ("likes", "date"):
+        sort_key, sort_desc = itemgetter(sort_by), True
+    elif sort_by == "sentiment" and has_tags:
+        sort_key, sort_desc = _sentiment_rank, False
+    else:
+        sort_key = None
 
     # Render comments as cards
     if not filtered:
@@ -1281,61 +1644,39 @@ def _render_comment_explorer(result: dict, wf: dict):
 
     start_idx = (page - 1) * page_size
     end_idx = min(start_idx + page_size, total_shown)
-    page_comments = filtered[start_idx:end_idx]
-
-    sent_colors = {
-        "positive": "#34D399", "negative": "#F87171",
-        "neutral": "#64748B", "mixed": "#FBBF24",
-    }
-
+    if sort_key is None:
+        page_comments = filtered[start_idx:end_idx]
+    elif page == 1:
+        # Only the first page is shown — partial selection is O(N log k)
+        # and gives the same (stable) order as a full sort
+        select = heapq.nlargest if sort_desc else heapq.nsmallest
+        page_comments = select(page_size, filtered, key=sort_key)
+    else:
+        # Later pages need the full order; keep the last sort so paging
+        # through the same filters doesn't re-sort on every rerun
+        # (a sorted copy, so the cached filter result keeps original order)
+        sort_state = (filter_state, sort_by)
+        cached = memo.get("explorer_sorted")
+        if cached is None or cached[0] != sort_state:
+            if sort_key is _sentiment_rank:
+                ordered = _sorted_by_sentiment(filtered)
+            else:
+                ordered = sorted(filtered, key=sort_key, reverse=sort_desc)
+            cached = memo["explorer_sorted"] = (sort_state, ordered)
+        page_comments = cached[1][start_idx:end_idx]
+
+    # Build every card first and emit them as a single markdown element (the
+    # .osc-* styles live in assets/style.css). Card HTML is kept per comment,
+    # so truncation and badge building happen once per comment rather than
+    # on every rerun.
+    card_cache = _result_memo(result, "card_html", dict)
+    cards = []
     for c in page_comments:
-        text = c.get("text", "")[:500]
-        platform = c.get("platform", "unknown")
-        username = c.get("username", "Anonymous")
-        likes = c.get("likes", 0)
-        date = c.get("date", "")
-        content_title = c.get("content_title", "")
-
-        # Build tag badges
-        badges = f'<span style="background:rgba(59,130,246,0.15);color:#60A5FA;padding:1px 6px;border-radius:3px;font-size:0.7rem;margin-right:4px">{platform.title()}</span>'
-
-        if has_tags:
-            sentiment = c.get("ai_sentiment", "neutral")
-            s_color = sent_colors.get(sentiment, "#64748B")
-            badges += f'<span style="background:{s_color}22;color:{s_color};padding:1px 6px;border-radius:3px;font-size:0.7rem;margin-right:4px">{sentiment}</span>'
-
-            # Intent and aspect badges only when full LLM tags are available
-            if has_full_tags:
-                intent = c.get("ai_intent", "other")
-                badges += f'<span style="background:rgba(139,92,246,0.15);color:#A78BFA;padding:1px 6px;border-radius:3px;font-size:0.7rem;margin-right:4px">{intent.replace("_", " ")}</span>'
-
-                # Aspect chips
-                for asp in c.get("ai_aspects", [])[:3]:
-                    a_name = asp.get("aspect", "")
-                    a_sent = asp.get("sentiment", "neutral")
-                    a_color = sent_colors.get(a_sent, "#64748B")
-                    badges += f'<span style="background:{a_color}15;color:{a_color};padding:1px 6px;border-radius:3px;font-size:0.68rem;margin-right:3px">{a_name}</span>'
-
-        title_html = ""
-        if content_title:
-            t = content_title[:120] + ("..." if len(content_title) > 120 else "")
-            title_html = (
-                f'<div style="font-size:0.78rem;color:#94A3B8;margin-bottom:4px;'
-                f'font-style:italic;border-left:2px solid rgba(59,130,246,0.3);'
-                f'padding-left:8px">Re: {t}</div>'
-            )
-
-        st.markdown(
-            f'<div style="border:1px solid rgba(255,255,255,0.06);border-radius:8px;'
-            f'padding:10px 14px;margin:4px 0">'
-            f'<div style="margin-bottom:4px">{badges}</div>'
-            f'{title_html}'
-            f'<div style="font-size:0.88rem;line-height:1.5">{text}</div>'
-            f'<div style="font-size:0.72rem;color:#64748B;margin-top:4px">'
-            f'@{username} | {likes} likes | {date}</div>'
-            f'</div>',
-            unsafe_allow_html=True,
-        )
+        html = card_cache.get(id(c))
+        if html is None:
+            html = card_cache[id(c)] = _comment_card_html(c, has_tags, has_full_tags)
+        cards.append(html)
+    st.markdown("".join(cards), unsafe_allow_html=True)
 
     if total_pages > 1:
         st.caption(f"Page {page} of {total_pages}")
@@ -1344,11 +1685,15 @@ def _render_comment_explorer(result: dict, wf: dict):
 def _regenerate_insight(wf: dict, result: dict):
     """Regenerate the AI Customer Insight Report using current data."""
     from ai.client import LLMClient
-    from ai.prompts import format_comments_for_prompt, CUSTOMER_INSIGHT_REPORT
 
     all_clean = result.get("comments_clean", [])
     platforms_str = ", ".join(wf["platforms"])
-    formatted = format_comments_for_prompt(all_clean[:500])
+    # The comments don't change within a search, so regenerating reuses the
+    # formatted prompt block
+    formatted = _result_memo(
+        result, "insight_prompt_comments",
+        lambda: format_comments_for_prompt(all_clean[:500]),
+    )
 
     tag_context = ""
     if result.get("tag_summary"):
@@ -1370,15 +1715,21 @@ def _regenerate_insight(wf: dict, result: dict):
         comments=formatted + tag_context,
     )
     client = LLMClient()
-    insight = run_async(client.analyze(prompt=prompt))
+    # Same prompt as the pipeline's first report (and earlier regenerations),
+    # so the provider's prompt cache can serve the input tokens
+    insight = run_async(client.analyze(prompt=prompt, cache_prompt=True))
     result["customer_insight"] = insight
 
 
+# Toolkit queries in flight at once. Only the independent ones run in
+# parallel; the bridge asks the ones that build on earlier answers last,
+# in the kept conversation
+_NLM_QUERY_CONCURRENCY = 3
+
+
 def _run_notebooklm_analysis(wf: dict, result: dict):
     """Execute automated NotebookLM toolkit analysis: 10 deep research queries."""
     from ai.notebooklm_bridge import get_bridge, NotebookLMBridge
-    from ai.toolkit_queries import get_toolkit_queries
-    from utils.notebooklm_export import export_comments_markdown
 
     comments = result.get("comments_clean", [])
     if not comments:
@@ -1397,9 +1748,29 @@ def _run_notebooklm_analysis(wf: dict, result: dict):
     bridge = get_bridge()
     progress = st.progress(0.0, text="Connecting to NotebookLM...")
 
+    # One placeholder per query, filled in as each answer arrives
+    labels = dict(TOOLKIT_TAB_CONFIG)
+    answers_box = st.container()
+    slots = {}
+    for q in queries:
+        label = labels.get(q["id"], q["id"].replace("_", " ").title())
+        slots[q["id"]] = (label, answers_box.empty())
+        slots[q["id"]][1].caption(f"{label} — waiting...")
+
     def _progress_cb(pct: float, msg: str):
         progress.progress(pct, text=msg)
 
+    def _answer_cb(qid: str, answer: str):
+        label, slot = slots.get(qid, (qid, None))
+        if slot is None:
+            return
+        if not answer:
+            slot.caption(f"{label} — no answer")
+            return
+        with slot.container():
+            with st.expander(label):
+                st.markdown(answer)
+
     try:
         raw_result = run_async(
             bridge.create_and_query(
@@ -1408,11 +1779,14 @@ def _run_notebooklm_analysis(wf: dict, result: dict):
                 queries=queries,
                 progress_cb=_progress_cb,
                 keep_alive=True,
+                answer_cb=_answer_cb,
+                concurrency=_NLM_QUERY_CONCURRENCY,
             )
         )
         NotebookLMBridge.increment_usage(len(queries))
     except Exception as e:
         progress.empty()
+        answers_box.empty()
         st.warning(
             f"NotebookLM analysis failed: {e}\n\n"
             "Check that NOTEBOOKLM_AUTH_JSON is set with valid cookies. "
@@ -1440,12 +1814,14 @@ def _run_notebooklm_analysis(wf: dict, result: dict):
         st.warning("NotebookLM analysis returned no results. Results will show without AI analysis.")
 
 
+@st.fragment
 def _render_nlm_chat(wf: dict):
     """Render interactive NotebookLM chat for follow-up questions.
 
     Chat history is rendered inside a fixed-height scrollable container
     to prevent the page from growing infinitely. The chat_input stays
-    outside the container (Streamlit requirement).
+    outside the container (Streamlit requirement). Runs as a fragment,
+    so sending a message reruns only the chat, not the dashboard above.
     """
     from ai.notebooklm_bridge import get_bridge, NotebookLMBridge
 
@@ -1534,7 +1910,25 @@ def _render_nlm_chat(wf: dict):
             chat_history.append({"role": "assistant", "content": f"Error: {err_msg}"})
 
     wf["nlm_chat_history"] = chat_history
-    st.rerun()
+    st.rerun(scope="fragment")
+
+
+_NO_RESULTS_MSG = (
+    "No comments found for this topic. Try a different search term, "
+    "broader date range, or different platforms."
+)
+
+
+def _render_new_search_button():
+    """Full-width button that resets the workflow to step 0.
+
+    The callback resets the workflow before the click's rerun, so that
+    rerun already draws step 0.
+    """
+    st.button(
+        "New Search", type="primary", use_container_width=True,
+        on_click=_reset_wf, key="os_new_search",
+    )
 
 
 def _render_results():
@@ -1551,142 +1945,141 @@ def _render_results():
 
     if not result:
         st.warning("No results available.")
-        if st.button("New Search", type="primary"):
-            _reset_wf()
-            st.rerun()
+        st.button("New Search", type="primary", on_click=_reset_wf)
         return
 
-    from utils.common import export_csv_bytes, export_json_bytes, fmt_num
-
-    total = result.get("total_comments", 0)
-
-    if total > 0:
-        # ── Always-visible header: platform metrics + downloads ──
-        st.markdown("### Results Summary")
-        raw_by_platform = result.get("comments_raw", {})
-        platforms = wf["platforms"]
-        summary_cols = st.columns(len(platforms))
-        for i, platform in enumerate(platforms):
-            count = len(raw_by_platform.get(platform, []))
-            summary_cols[i].metric(platform.title(), fmt_num(count))
-
-        # Store in session state for other pages
-        clean_comments = result.get("comments_clean", [])
-        st.session_state["last_scrape"] = {
-            "comments": clean_comments,
-            "raw_comments": [],
-            "platform": "multi",
-            "count": len(clean_comments),
-        }
+    if not result.get("total_comments", 0):
+        st.info(_NO_RESULTS_MSG)
+        _render_pipeline_details(result)
+        _render_new_search_button()
+        return
 
-        # Download buttons
-        dl_col1, dl_col2, dl_spacer = st.columns([1, 1, 2])
-        with dl_col1:
-            st.download_button(
-                "Export CSV",
-                data=export_csv_bytes(clean_comments),
-                file_name=f"one_search_{wf['topic'].replace(' ', '_')}.csv",
-                mime="text/csv",
-                use_container_width=True,
-                key="dl_csv",
-            )
-        with dl_col2:
-            st.download_button(
-                "Export JSON",
-                data=export_json_bytes(clean_comments),
-                file_name=f"one_search_{wf['topic'].replace(' ', '_')}.json",
-                mime="application/json",
-                use_container_width=True,
-                key="dl_json",
-            )
+    # ── Always-visible header: platform metrics + downloads ──
+    st.markdown("### Results Summary")
+    raw_by_platform = result.get("comments_raw", {})
+    platforms = wf["platforms"]
+    summary_cols = st.columns(len(platforms))
+    for i, platform in enumerate(platforms):
+        count = len(raw_by_platform.get(platform, []))
+        summary_cols[i].metric(platform.title(), fmt_num(count))
+
+    # Store in session state for other pages
+    clean_comments = result.get("comments_clean", [])
+    st.session_state["last_scrape"] = {
+        "comments": clean_comments,
+        "raw_comments": [],
+        "platform": "multi",
+        "count": len(clean_comments),
+    }
 
-        # ── Tab-based dashboard ──
-        tab_overview, tab_ai, tab_explorer, tab_data = st.tabs(
-            ["Overview", "AI Analysis", "Explorer", "Data"]
+    # Download buttons — the bytes are produced on the first click (on
+    # Streamlit's download thread) and memoized for the search; they are not
+    # prefetched, so reruns and searches nobody exports never serialize them
+    def csv_bytes():
+        return _result_memo(result, "export_csv", lambda: export_csv_bytes(clean_comments))
+
+    def json_bytes():
+        return _result_memo(result, "export_json", lambda: export_json_bytes(clean_comments))
+
+    dl_col1, dl_col2, dl_spacer = st.columns([1, 1, 2])
+    with dl_col1:
+        st.download_button(
+            "Export CSV",
+            data=csv_bytes,
+            file_name=f"one_search_{wf['topic'].replace(' ', '_')}.csv",
+            mime="text/csv",
+            use_container_width=True,
+            key="dl_csv",
+        )
+    with dl_col2:
+        st.download_button(
+            "Export JSON",
+            data=json_bytes,
+            file_name=f"one_search_{wf['topic'].replace(' ', '_')}.json",
+            mime="application/json",
+            use_container_width=True,
+            key="dl_json",
         )
 
-        # --- Overview tab: Stats report ---
-        with tab_overview:
-            analysis = result.get("analysis")
-            if analysis:
-                try:
-                    from utils.stats_report import compose_stats_report, render_stats_report
-                    stats_report = compose_stats_report(analysis)
-                    if stats_report:
-                        render_stats_report(stats_report)
-                except Exception:
-                    st.info("Stats report could not be generated.")
-            else:
-                st.info("No analysis data available. Run a search with enough comments to see statistics.")
+    # ── Tab-based dashboard ──
+    tab_overview, tab_ai, tab_explorer, tab_data = st.tabs(
+        ["Overview", "AI Analysis", "Explorer", "Data"]
+    )
+
+    # --- Overview tab: Stats report ---
+    with tab_overview:
+        analysis = result.get("analysis")
+        if analysis:
+            try:
+                # Composed once per search; tab and widget reruns reuse it
+                stats_report = _result_memo(
+                    result, "stats_report", lambda: compose_stats_report(analysis),
+                )
+                if stats_report:
+                    render_stats_report(stats_report)
+            except Exception:
+                st.info("Stats report could not be generated.")
+        else:
+            st.info("No analysis data available. Run a search with enough comments to see statistics.")
 
-        # --- AI Analysis tab: Toolkit report OR legacy AI report ---
-        with tab_ai:
-            toolkit_results = result.get("toolkit_results")
-            customer_insight = result.get("customer_insight")
+    # --- AI Analysis tab: Toolkit report OR legacy AI report ---
+    with tab_ai:
+        toolkit_results = result.get("toolkit_results")
+        customer_insight = result.get("customer_insight")
 
-            if toolkit_results:
-                from ai.toolkit_renderer import render_toolkit_report
-                render_toolkit_report(toolkit_results, wf["topic"])
+        if toolkit_results:
+            render_toolkit_report(toolkit_results, wf["topic"])
 
-                if st.button("Re-analyze with NotebookLM", key="regen_insight"):
-                    with st.spinner("Re-running toolkit analysis (10 queries)..."):
-                        _run_notebooklm_analysis(wf, result)
+            if st.button("Re-analyze with NotebookLM", key="regen_insight"):
+                with st.spinner("Re-running toolkit analysis (10 queries)..."):
+                    _run_notebooklm_analysis(wf, result)
+                    st.rerun()
+
+        elif customer_insight:
+            _render_customer_insight(customer_insight, wf["topic"])
+            if st.button("Regenerate AI Report", key="regen_insight"):
+                with st.spinner("Regenerating AI Customer Insight Report..."):
+                    try:
+                        _regenerate_insight(wf, result)
                         st.rerun()
+                    except Exception as e:
+                        st.error(f"Regeneration failed: {e}")
 
-            elif customer_insight:
-                _render_customer_insight(customer_insight, wf["topic"])
-                if st.button("Regenerate AI Report", key="regen_insight"):
-                    with st.spinner("Regenerating AI Customer Insight Report..."):
+        elif clean_comments:
+            if _is_nlm_mode():
+                st.info("No AI analysis yet. Click below to generate a toolkit report.")
+                if st.button("Generate Toolkit Report via NotebookLM", type="primary", key="gen_insight_nlm"):
+                    with st.spinner("Running toolkit analysis (10 queries)..."):
+                        _run_notebooklm_analysis(wf, result)
+                        st.rerun()
+            else:
+                st.info("No AI analysis yet. Click below to generate an insight report.")
+                if st.button("Generate AI Customer Insight Report", type="primary", key="gen_insight"):
+                    with st.spinner("Generating AI Customer Insight Report..."):
                         try:
                             _regenerate_insight(wf, result)
                             st.rerun()
                         except Exception as e:
-                            st.error(f"Regeneration failed: {e}")
-
-            elif clean_comments:
-                if _is_nlm_mode():
-                    st.info("No AI analysis yet. Click below to generate a toolkit report.")
-                    if st.button("Generate Toolkit Report via NotebookLM", type="primary", key="gen_insight_nlm"):
-                        with st.spinner("Running toolkit analysis (10 queries)..."):
-                            _run_notebooklm_analysis(wf, result)
-                            st.rerun()
-                else:
-                    st.info("No AI analysis yet. Click below to generate an insight report.")
-                    if st.button("Generate AI Customer Insight Report", type="primary", key="gen_insight"):
-                        with st.spinner("Generating AI Customer Insight Report..."):
-                            try:
-                                _regenerate_insight(wf, result)
-                                st.rerun()
-                            except Exception as e:
-                                st.error(f"Generation failed: {e}")
-            else:
-                st.info("Not enough comments for AI analysis.")
-
-        # --- Explorer tab: Comment explorer + aspect heatmap + cross-platform ---
-        with tab_explorer:
-            _render_cross_platform(result)
-            _render_aspect_heatmap(result)
-            _render_comment_explorer(result, wf)
+                            st.error(f"Generation failed: {e}")
+        else:
+            st.info("Not enough comments for AI analysis.")
 
-        # --- Data tab: Collection details + pipeline info ---
-        with tab_data:
-            _render_pipeline_details(result)
+    # --- Explorer tab: Comment explorer + aspect heatmap + cross-platform ---
+    with tab_explorer:
+        _render_cross_platform(result)
+        _render_aspect_heatmap(result)
+        _render_comment_explorer(result, wf)
 
-        # ── Chat section below tabs (avoids tab-reset on rerun) ──
-        _render_nlm_chat(wf)
+    # ── Chat section below tabs (avoids tab-reset on rerun) ──
+    _render_nlm_chat(wf)
 
-    else:
-        st.info(
-            "No comments found for this topic. Try a different search term, "
-            "broader date range, or different platforms."
-        )
+    # --- Data tab: Collection details + pipeline info ---
+    # Filled last: the tab container is already laid out, so deferring
+    # its contents lets the visible tab and chat paint first
+    with tab_data:
         _render_pipeline_details(result)
 
-    # New Search button
-    st.markdown("")
-    if st.button("New Search", type="primary", use_container_width=True):
-        _reset_wf()
-        st.rerun()
+    _render_new_search_button()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -1700,14 +2093,18 @@ current_step = wf.get("step", 0)
 if current_step > 0:
     _render_step_indicator(current_step)
 
-# Route to the current step
-if current_step == 0:
-    _render_input()
-elif current_step == 1:
-    _render_query_review()
-elif current_step == 2:
-    _render_url_review()
-elif current_step == 3:
-    _render_scraping()
-elif current_step == 4:
-    _render_results()
+# Route to the current step in the main script run. Navigation buttons
+# switch steps in their on_click callback, so the click's own rerun draws
+# the new step; buttons that do work first (searching, scraping) call
+# st.rerun() once it is done. Only independent widgets (URL editor tabs,
+# explorer, aspect drill-down, chat) run as fragments.
+# Indexed by step number, in STEP_LABELS order.
+_STEP_RENDERERS = (
+    _render_input,
+    _render_query_review,
+    _render_url_review,
+    _render_scraping,
+    _render_results,
+)
+if 0 <= current_step < len(_STEP_RENDERERS):
+    _STEP_RENDERERS[current_step]()
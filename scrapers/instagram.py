@@ -19,6 +19,8 @@ from datetime import datetime, timezone
 
 import aiohttp
 
+from utils.http import shared_session
+
 # ──────────────────────────────────────────────
 # Constants & Config
 # ──────────────────────────────────────────────
@@ -250,7 +252,7 @@ async def init_session(
     }
 
     jar = aiohttp.CookieJar()
-    session = aiohttp.ClientSession(headers=headers, cookie_jar=jar)
+    session = shared_session(headers=headers, cookie_jar=jar)
 
     csrf_token = ""
     has_auth = False
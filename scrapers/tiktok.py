@@ -20,6 +20,7 @@ from urllib.parse import urlencode, urlparse, parse_qs
 import aiohttp
 
 from utils.common import AdaptiveDelay
+from utils.http import shared_session
 
 # Optional Playwright import
 PLAYWRIGHT_AVAILABLE = False
@@ -226,8 +227,7 @@ class TikTokCommentScraper:
 
         self._progress("Fetching comments...")
 
-        connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
-        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+        async with shared_session(headers=headers) as session:
             while has_more:
                 if deadline and time.monotonic() > deadline:
                     self._progress(
@@ -724,9 +724,9 @@ class TikTokCommentScraper:
                     self._progress(f"Loading replies... ({idx + 1}/{len(comments_with_replies)})")
                 return result
 
-        connector = aiohttp.TCPConnector(limit=concurrency + 2, keepalive_timeout=30)
-        async with aiohttp.ClientSession(
-            headers=headers, cookies=cookies, connector=connector
+        # Pool sized like the old per-call connector (concurrency + 2)
+        async with shared_session(
+            limit_per_host=concurrency + 2, headers=headers, cookies=cookies,
         ) as session:
             tasks = [
                 bounded_fetch(session, c, i)
@@ -753,7 +753,7 @@ class TikTokCommentScraper:
         has_direct_id = bool(re.search(r"/(?:video|photo)/\d+", url))
         if not has_direct_id and "tiktok.com" in url:
             try:
-                async with aiohttp.ClientSession(
+                async with shared_session(
                     headers={"User-Agent": USER_AGENT}
                 ) as session:
                     async with session.head(
@@ -779,7 +779,7 @@ class TikTokCommentScraper:
         oembed_url = f"https://www.tiktok.com/oembed?url={video_url}"
         for attempt in range(MAX_RETRIES):
             try:
-                async with aiohttp.ClientSession(
+                async with shared_session(
                     headers={"User-Agent": USER_AGENT}
                 ) as session:
                     async with session.get(
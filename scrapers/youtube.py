@@ -22,6 +22,7 @@ import aiohttp
 import requests
 
 from utils.common import AdaptiveDelay, _parse_count_string
+from utils.http import shared_session
 
 # Optional: Playwright (only for Method 3)
 PLAYWRIGHT_AVAILABLE = False
@@ -746,10 +747,9 @@ class YouTubeCommentScraper:
 
         delay = AdaptiveDelay(min_delay=0.3, max_delay=10.0, initial=1.5)
 
-        connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
         cookie_jar = aiohttp.CookieJar()
-        async with aiohttp.ClientSession(
-            headers=headers, connector=connector, cookie_jar=cookie_jar,
+        async with shared_session(
+            headers=headers, cookie_jar=cookie_jar,
         ) as session:
             # Set cookies if available
             if self._cookies:
@@ -1362,11 +1362,9 @@ class YouTubeCommentScraper:
                 reply_delay = AdaptiveDelay(
                     min_delay=0.5, max_delay=10.0, initial=2.0,
                 )
-                reply_connector = aiohttp.TCPConnector(limit=5, keepalive_timeout=30)
-                async with aiohttp.ClientSession(
+                async with shared_session(
                     headers=reply_headers,
                     cookies=cookies_dict,
-                    connector=reply_connector,
                 ) as reply_session:
                     replies = await self._fetch_replies_innertube(
                         reply_session, reply_continuations_all, comment_ids_seen,
@@ -22,6 +22,8 @@ from urllib.parse import quote_plus, unquote
 
 import requests
 
+from utils.cache import LRUCache, key_fingerprint
+
 
 # ---------------------------------------------------------------------------
 # Serper.dev (primary — lightweight, full Google operator support)
@@ -269,6 +271,58 @@ def _search_ddg(query: str, max_results: int = 20) -> list[dict]:
 # Main search function (tries backends in order)
 # ---------------------------------------------------------------------------
 
+# ---------------------------------------------------------------------------
+# Result cache — repeat searches (Back → Approve, Search More, re-running a
+# topic) reuse recent results instead of spending API quota and rate-limit
+# pauses. Empty results are not cached so a failed backend is retried.
+# Shared by all sessions, so keys follow the policy in utils/cache.py.
+# ---------------------------------------------------------------------------
+
+_SEARCH_CACHE_TTL = 3600  # seconds
+_SEARCH_CACHE_SIZE = 512
+_search_cache = LRUCache(_SEARCH_CACHE_SIZE, ttl=_SEARCH_CACHE_TTL)
+
+
+def _search_backends(query: str, max_results: int, gl: str, hl: str) -> tuple:
+    """(cache key, search call) per backend, in priority order.
+
+    Paid backends are keyed on the API key that pays for the search; the
+    free DuckDuckGo fallback has none.
+    """
+    return (
+        (
+            ("serper", key_fingerprint(_get_serper_key()), query, max_results, gl, hl),
+            lambda: _search_serper(query, max_results, gl, hl),
+        ),
+        (
+            ("serpapi", key_fingerprint(_get_serpapi_key()), query, max_results, gl, hl),
+            lambda: _search_serpapi(query, max_results, gl, hl),
+        ),
+        (
+            ("ddg", "", query, max_results),
+            lambda: _search_ddg(query, max_results),
+        ),
+    )
+
+
+def _search_with_cache(
+    query: str, max_results: int, gl: str, hl: str,
+) -> tuple[list[dict], bool]:
+    """Search the backends in order; returns (results, served from cache)."""
+    backends = _search_backends(query, max_results, gl, hl)
+    for key, _ in backends:
+        results = _search_cache.get(key)
+        if results is not None:
+            return list(results), True
+
+    for key, search in backends:
+        results = search()
+        if results:
+            _search_cache.set(key, results)
+            return list(results), False
+    return [], False
+
+
 def search_google(
     query: str,
     max_results: int = 20,
@@ -290,28 +344,13 @@ def search_google(
     Returns:
         List of {"url": str, "title": str, "snippet": str}
     """
-    # Try backends in priority order
-    results = _search_serper(query, max_results, gl, hl)
-    if results:
-        if progress_callback:
-            progress_callback(f"Found {len(results)} results")
-        return results
-
-    results = _search_serpapi(query, max_results, gl, hl)
-    if results:
-        if progress_callback:
-            progress_callback(f"Found {len(results)} results")
-        return results
-
-    results = _search_ddg(query, max_results)
-    if results:
-        if progress_callback:
-            progress_callback(f"Found {len(results)} results")
-        return results
-
+    results, _ = _search_with_cache(query, max_results, gl, hl)
     if progress_callback:
-        progress_callback("No results found for this query")
-    return []
+        if results:
+            progress_callback(f"Found {len(results)} results")
+        else:
+            progress_callback("No results found for this query")
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -425,12 +464,9 @@ def search_multi_queries(
             if progress_callback:
                 progress_callback(f"Searching {platform.title()}...")
 
-            results = search_google(
-                query,
-                max_results=max_results_per_query,
-                progress_callback=None,  # Don't spam per-query messages
-                gl=gl,
-                hl=hl,
+            # No per-query progress messages (they would spam the log)
+            results, cached = _search_with_cache(
+                query, max_results_per_query, gl, hl,
             )
             new_count = 0
             for r in results:
@@ -444,8 +480,9 @@ def search_multi_queries(
                     f"{platform.title()}: found {len(platform_results)} relevant content"
                 )
 
-            # Rate limiting between queries
-            time.sleep(random.uniform(0.3, 0.8))
+            # Rate limiting between queries (cached answers made no request)
+            if not cached:
+                time.sleep(random.uniform(0.3, 0.8))
 
         all_results[platform] = platform_results
         if progress_callback:
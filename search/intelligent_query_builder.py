@@ -12,6 +12,7 @@ Works with or without an LLM key:
 Returns IntelligentQueryResult with per-platform queries + relevance_keywords.
 """
 
+import copy
 import json
 import re
 from dataclasses import dataclass, field
@@ -22,6 +23,7 @@ from search.thai_nlp import (
     get_thai_transliterations,
     segment_thai,
 )
+from utils.cache import LRUCache, key_fingerprint
 
 # ---------------------------------------------------------------------------
 # Data model
@@ -421,6 +423,14 @@ Return ONLY a JSON object:
 Platforms to generate for: {platforms}"""
 
 
+# Parsed LLM strategies, so re-running the same topic skips the LLM round
+# trip. Only successful LLM results land here — a failed call falls back to
+# the rule-based path and is retried next time. Shared by all sessions, so
+# keys follow the policy in utils/cache.py.
+_LLM_CACHE_SIZE = 128
+_llm_cache = LRUCache(_LLM_CACHE_SIZE)
+
+
 async def _strategize_with_llm(
     user_input: str,
     platforms: list[str],
@@ -430,12 +440,28 @@ async def _strategize_with_llm(
     """Use LLM to generate per-platform query strings."""
     from ai.client import LLMClient
 
+    client = LLMClient()
+
+    # Date filters are relative to today, so the day is part of the key
+    cache_key = (
+        " ".join(user_input.lower().split()),
+        tuple(sorted(platforms)),
+        json.dumps(date_range, sort_keys=True),
+        max_queries_per_platform,
+        client.provider,
+        key_fingerprint(client.api_key),
+        datetime.now().date(),
+    )
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
+        # Callers edit the query lists in place
+        return copy.deepcopy(cached)
+
     prompt = _STRATEGIST_PROMPT.format(
         max_q=max_queries_per_platform,
         platforms=", ".join(platforms),
     )
 
-    client = LLMClient()
     result = await client.analyze(
         prompt=prompt,
         data=f"User input: {user_input}",
@@ -491,12 +517,14 @@ async def _strategize_with_llm(
                 for q in queries[platform]
             ]
 
-    return IntelligentQueryResult(
+    result = IntelligentQueryResult(
         queries=queries,
         relevance_keywords=relevance_keywords,
         research_question=research_question,
         hypotheses=hypotheses,
     )
+    _llm_cache.set(cache_key, copy.deepcopy(result))
+    return result
 
 
 # ---------------------------------------------------------------------------
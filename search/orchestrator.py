@@ -12,6 +12,7 @@ async def scrape_platform_urls(
     cookies: dict | list | None = None,
     progress_callback=None,
     max_comments_per_url: int = 200,
+    result_queue: asyncio.Queue | None = None,
 ) -> list[dict]:
     """Scrape comments from a list of URLs for a single platform.
 
@@ -21,6 +22,8 @@ async def scrape_platform_urls(
         cookies: Platform-specific cookies (if needed)
         progress_callback: Progress callback function
         max_comments_per_url: Max comments to fetch per URL
+        result_queue: Optional queue that receives a
+            {platform, url, comments} item as each URL finishes
 
     Returns:
         List of raw comment dicts
@@ -31,18 +34,24 @@ async def scrape_platform_urls(
     all_comments = []
 
     if platform == "youtube":
-        all_comments = await _scrape_youtube(urls, cookies, progress_callback, max_comments_per_url)
+        all_comments = await _scrape_youtube(urls, cookies, progress_callback, max_comments_per_url, result_queue)
     elif platform == "tiktok":
-        all_comments = await _scrape_tiktok(urls, progress_callback, max_comments_per_url)
+        all_comments = await _scrape_tiktok(urls, progress_callback, max_comments_per_url, result_queue)
     elif platform == "facebook":
-        all_comments = await _scrape_facebook(urls, cookies, progress_callback)
+        all_comments = await _scrape_facebook(urls, cookies, progress_callback, result_queue)
     elif platform == "instagram":
-        all_comments = await _scrape_instagram(urls, cookies, progress_callback)
+        all_comments = await _scrape_instagram(urls, cookies, progress_callback, result_queue)
 
     return all_comments
 
 
-async def _scrape_youtube(urls, cookies, callback, max_comments):
+async def _emit_url_result(queue, platform: str, url: str, comments: list[dict]):
+    """Push a finished URL's comments onto the streaming queue (if any)."""
+    if queue is not None:
+        await queue.put({"platform": platform, "url": url, "comments": comments})
+
+
+async def _scrape_youtube(urls, cookies, callback, max_comments, queue=None):
     """Scrape YouTube comments from multiple URLs."""
     try:
         from scrapers.youtube import YouTubeCommentScraper
@@ -65,6 +74,7 @@ async def _scrape_youtube(urls, cookies, callback, max_comments):
     for i, url in enumerate(urls):
         if callback:
             callback(f"YouTube {i+1}/{len(urls)}: {url[:60]}...")
+        result = None
         try:
             result = await scraper.scrape_video_comments(url)
             if result:
@@ -74,12 +84,13 @@ async def _scrape_youtube(urls, cookies, callback, max_comments):
         except Exception:
             if callback:
                 callback(f"Failed to scrape YouTube video {i+1}")
+        await _emit_url_result(queue, "youtube", url, result or [])
         await asyncio.sleep(1.0)
 
     return comments
 
 
-async def _scrape_tiktok(urls, callback, max_comments):
+async def _scrape_tiktok(urls, callback, max_comments, queue=None):
     """Scrape TikTok comments from multiple URLs."""
     try:
         from scrapers.tiktok import TikTokCommentScraper
@@ -99,6 +110,7 @@ async def _scrape_tiktok(urls, callback, max_comments):
     for i, url in enumerate(urls):
         if callback:
             callback(f"TikTok {i+1}/{len(urls)}: {url[:60]}...")
+        result = None
         try:
             result = await scraper.scrape_video_comments(url)
             if result:
@@ -108,12 +120,13 @@ async def _scrape_tiktok(urls, callback, max_comments):
         except Exception:
             if callback:
                 callback(f"Failed to scrape TikTok video {i+1}")
+        await _emit_url_result(queue, "tiktok", url, result or [])
         await asyncio.sleep(1.0)
 
     return comments
 
 
-async def _scrape_facebook(urls, cookies, callback):
+async def _scrape_facebook(urls, cookies, callback, queue=None):
     """Scrape Facebook comments from multiple URLs."""
     if not cookies:
         if callback:
@@ -131,6 +144,7 @@ async def _scrape_facebook(urls, cookies, callback):
     for i, url in enumerate(urls):
         if callback:
             callback(f"Facebook {i+1}/{len(urls)}: {url[:60]}...")
+        result = None
         try:
             result = await scrape_comments_fast(url, cookies=cookies, progress_callback=callback)
             if result:
@@ -140,12 +154,13 @@ async def _scrape_facebook(urls, cookies, callback):
         except Exception:
             if callback:
                 callback(f"Failed to scrape Facebook post {i+1}")
+        await _emit_url_result(queue, "facebook", url, result or [])
         await asyncio.sleep(1.5)
 
     return comments
 
 
-async def _scrape_instagram(urls, cookies, callback):
+async def _scrape_instagram(urls, cookies, callback, queue=None):
     """Scrape Instagram comments from multiple URLs."""
     try:
         from scrapers.instagram import scrape_post_urls
@@ -154,16 +169,24 @@ async def _scrape_instagram(urls, cookies, callback):
             callback("Instagram scraper not available")
         return []
 
-    if callback:
-        callback(f"Scraping {len(urls)} Instagram posts...")
-
-    try:
-        comments = await scrape_post_urls(urls, cookies=cookies, progress_callback=callback)
-        return comments or []
-    except Exception:
+    comments = []
+    for i, url in enumerate(urls):
         if callback:
-            callback("Failed to scrape Instagram posts")
-        return []
+            callback(f"Instagram {i+1}/{len(urls)}: {url[:60]}...")
+        result = None
+        try:
+            # One URL per call, so each post streams as its own result
+            result = await scrape_post_urls([url], cookies=cookies, progress_callback=callback)
+            if result:
+                comments.extend(result)
+                if callback:
+                    callback(f"Got {len(result)} comments from Instagram post")
+        except Exception:
+            if callback:
+                callback(f"Failed to scrape Instagram post {i+1}")
+        await _emit_url_result(queue, "instagram", url, result or [])
+
+    return comments
 
 
 async def scrape_all_platforms(
@@ -171,6 +194,8 @@ async def scrape_all_platforms(
     cookies_map: dict[str, dict | list | None] | None = None,
     progress_callback=None,
     max_comments_per_url: int = 200,
+    result_queue: asyncio.Queue | None = None,
+    concurrency: int = 1,
 ) -> dict[str, list[dict]]:
     """Scrape comments across all platforms.
 
@@ -179,6 +204,10 @@ async def scrape_all_platforms(
         cookies_map: {platform: cookies} for platforms requiring auth
         progress_callback: Progress callback function
         max_comments_per_url: Max comments per URL
+        result_queue: Optional queue fed with per-URL results as they finish
+        concurrency: How many platforms to scrape at once. URLs within a
+            platform stay sequential (with their rate-limit pauses); each
+            platform slot may hold a headless browser, so keep this small.
 
     Returns:
         {platform: [comment_dicts]}
@@ -186,28 +215,31 @@ async def scrape_all_platforms(
     if cookies_map is None:
         cookies_map = {}
 
-    results = {}
+    sem = asyncio.Semaphore(max(1, concurrency))
 
-    for platform, urls in url_map.items():
-        if not urls:
-            continue
+    async def _scrape_one(platform: str, urls: list[str]) -> list[dict]:
+        async with sem:
+            if progress_callback:
+                progress_callback(f"Scraping {len(urls)} {platform.title()} URLs...")
 
-        if progress_callback:
-            progress_callback(f"Scraping {len(urls)} {platform.title()} URLs...")
-
-        cookies = cookies_map.get(platform)
-        platform_comments = await scrape_platform_urls(
-            platform=platform,
-            urls=urls,
-            cookies=cookies,
-            progress_callback=progress_callback,
-            max_comments_per_url=max_comments_per_url,
-        )
-        results[platform] = platform_comments
-
-        if progress_callback:
-            progress_callback(
-                f"Finished {platform.title()}: {len(platform_comments)} comments"
+            platform_comments = await scrape_platform_urls(
+                platform=platform,
+                urls=urls,
+                cookies=cookies_map.get(platform),
+                progress_callback=progress_callback,
+                max_comments_per_url=max_comments_per_url,
+                result_queue=result_queue,
             )
 
-    return results
+            if progress_callback:
+                progress_callback(
+                    f"Finished {platform.title()}: {len(platform_comments)} comments"
+                )
+            return platform_comments
+
+    # gather keeps url_map order, so results match the sequential version
+    platforms = [p for p, urls in url_map.items() if urls]
+    scraped = await asyncio.gather(
+        *[_scrape_one(p, url_map[p]) for p in platforms]
+    )
+    return dict(zip(platforms, scraped))
@@ -6,11 +6,13 @@ Provides both:
   - run_one_search(): monolithic pipeline (backward compat)
   - step_generate_queries / step_search_urls / step_scrape_and_analyze:
     individual steps for the interactive step-by-step workflow
+    (step_search_urls_async searches platforms concurrently)
 """
 
 import asyncio
 import re
 from collections import Counter
+from functools import lru_cache
 
 from search.query_builder import build_queries, extract_urls_from_results
 from search.google_search import search_multi_queries
@@ -430,6 +432,69 @@ def step_search_urls(
         relevance_keywords=relevance_keywords,
     )
 
+    return _build_url_search_result(
+        search_results, platforms, max_urls_per_platform, progress_callback,
+    )
+
+
+# Max platforms searched at the same time by step_search_urls_async
+_SEARCH_CONCURRENCY = 4
+
+
+async def step_search_urls_async(
+    queries: dict[str, list[str]],
+    platforms: list[str],
+    max_urls_per_platform: int = 15,
+    topic: str = "",
+    relevance_keywords: list[str] | None = None,
+    progress_callback=None,
+) -> dict:
+    """Step 2 (concurrent): search all platforms in parallel.
+
+    search_multi_queries is blocking (HTTP calls + rate-limit sleeps), so
+    each platform runs in a worker thread, bounded by a semaphore.
+    Progress messages are handed back to the event loop thread so UI
+    callbacks keep their Streamlit context.
+
+    Returns same shape as step_search_urls.
+    """
+    if progress_callback:
+        progress_callback("Searching for relevant content...")
+
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(_SEARCH_CONCURRENCY)
+
+    def _loop_progress(msg):
+        loop.call_soon_threadsafe(progress_callback, msg)
+
+    async def _search_one(platform: str) -> dict:
+        async with sem:
+            return await asyncio.to_thread(
+                search_multi_queries,
+                {platform: queries[platform]},
+                max_results_per_query=max_urls_per_platform,
+                progress_callback=_loop_progress if progress_callback else None,
+                topic=topic,
+                target_urls_per_platform=max_urls_per_platform,
+                relevance_keywords=relevance_keywords,
+            )
+
+    search_results = {}
+    for platform_results in await asyncio.gather(*[_search_one(p) for p in queries]):
+        search_results.update(platform_results)
+
+    return _build_url_search_result(
+        search_results, platforms, max_urls_per_platform, progress_callback,
+    )
+
+
+def _build_url_search_result(
+    search_results: dict[str, list[dict]],
+    platforms: list[str],
+    max_urls_per_platform: int,
+    progress_callback=None,
+) -> dict:
+    """Extract per-platform URLs + titles from raw search results."""
     # Extract and filter URLs per platform
     url_map = {}
     for platform in platforms:
@@ -468,6 +533,8 @@ async def step_scrape_and_analyze(
     max_comments_per_url: int = 200,
     topic: str = "",
     progress_callback=None,
+    result_queue: asyncio.Queue | None = None,
+    concurrency: int = 1,
 ) -> dict:
     """Step 3: Scrape comments, normalize, analyze, and generate AI insight.
 
@@ -478,6 +545,9 @@ async def step_scrape_and_analyze(
         max_comments_per_url: max comments per URL
         topic: original search topic
         progress_callback: callback
+        result_queue: optional queue that receives a {platform, url, comments}
+            item as each URL finishes scraping, then None once scraping ends
+        concurrency: number of platforms scraped at once
 
     Returns:
         Full result dict with comments_raw, comments_clean, analysis,
@@ -501,18 +571,27 @@ async def step_scrape_and_analyze(
     if total_urls == 0:
         if progress_callback:
             progress_callback("No URLs to scrape.")
+        if result_queue is not None:
+            await result_queue.put(None)
         return result
 
     # Scrape comments
     if progress_callback:
         progress_callback("Scraping comments across platforms...")
 
-    raw_comments = await scrape_all_platforms(
-        url_map=url_map,
-        cookies_map=cookies_map,
-        progress_callback=progress_callback,
-        max_comments_per_url=max_comments_per_url,
-    )
+    try:
+        raw_comments = await scrape_all_platforms(
+            url_map=url_map,
+            cookies_map=cookies_map,
+            progress_callback=progress_callback,
+            max_comments_per_url=max_comments_per_url,
+            result_queue=result_queue,
+            concurrency=concurrency,
+        )
+    finally:
+        # End-of-stream marker (also on failure) so consumers stop waiting
+        if result_queue is not None:
+            await result_queue.put(None)
     result["comments_raw"] = raw_comments
 
     # Normalize
@@ -621,7 +700,9 @@ async def step_scrape_and_analyze(
                     comments=formatted + tag_context,
                 )
                 client = LLMClient()
-                insight = await client.analyze(prompt=prompt)
+                # Regenerating the report on the Results step resends this
+                # exact prompt
+                insight = await client.analyze(prompt=prompt, cache_prompt=True)
                 result["customer_insight"] = insight
             except Exception as e:
                 if progress_callback:
@@ -673,7 +754,7 @@ def _parse_nlm_query_response(response: str, platforms: list[str]) -> dict:
       - Headers like ## YouTube, **YouTube**, YouTube:
       - Bullet points (- query, * query, • query) and numbered lists (1. query)
       - Strips Google operators (site:, after:, before:) since they get
-        added back by _restore_operators()
+        added back by _operator_affixes() on the One Search page
       - Skips intro/explanatory paragraphs NLM may prepend
     """
     platform_aliases = {
@@ -700,7 +781,7 @@ def _parse_nlm_query_response(response: str, platforms: list[str]) -> dict:
         if is_bullet:
             query = _extract_query_text(stripped)
             if query and current_platform:
-                query = _strip_google_operators(query)
+                query = strip_google_operators(query)
                 if query:
                     result[current_platform].append(query)
         else:
@@ -719,7 +800,7 @@ def _parse_nlm_query_response(response: str, platforms: list[str]) -> dict:
             stripped = line.strip()
             q = _extract_query_text(stripped)
             if q:
-                q = _strip_google_operators(q)
+                q = strip_google_operators(q)
                 if q:
                     all_queries.append(q)
         if all_queries:
@@ -786,13 +867,35 @@ def _extract_query_text(line: str) -> str:
     return text
 
 
-def _strip_google_operators(query: str) -> str:
-    """Strip site:, after:, before:, intitle:, inurl: operators from a query."""
-    q = re.sub(r'site:\S+', '', query)
-    q = re.sub(r'(?:after|before):\d{4}-\d{2}-\d{2}', '', q)
-    q = re.sub(r'-?(?:intitle|inurl):', '', q)
-    q = re.sub(r'\s+', ' ', q).strip()
-    return q
+# site:anything | after:/before:YYYY-MM-DD | intitle:/inurl: prefixes (with -)
+_RE_OPERATORS = re.compile(
+    r'site:\S+|(?:after|before):\d{4}-\d{2}-\d{2}|-?(?:intitle|inurl):'
+)
+
+
+@lru_cache(maxsize=4096)
+def strip_google_operators(query: str) -> str:
+    """Strip site:, after:, before:, intitle:, inurl: operators from a query.
+
+    Cached: the One Search page strips every query on every rerun, and the
+    same strings come back each time.
+    """
+    # Every operator needs a colon — plain user-typed queries skip the regex
+    if ":" in query:
+        query = _RE_OPERATORS.sub('', query)
+    # str.split() collapses whitespace runs and trims the ends in one C pass
+    return " ".join(query.split())
+
+
+@lru_cache(maxsize=256)
+def unique_clean_queries(queries: tuple[str, ...]) -> tuple[str, ...]:
+    """Strip operators from each query, dropping empties and duplicates.
+
+    Order is kept. Operators may have been the only difference between
+    two queries, so deduplication happens after stripping.
+    """
+    # dict keys keep insertion order, so fromkeys dedupes in one pass
+    return tuple(dict.fromkeys(filter(None, map(strip_google_operators, queries))))
 
 
 # ---------------------------------------------------------------------------
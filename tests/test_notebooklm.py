@@ -589,6 +589,148 @@ class TestBridgeBudget:
         assert remaining == 50
 
 
+@pytest.fixture
+def fake_bridge(monkeypatch):
+    """Build a NotebookLMBridge whose client answers via the given ask().
+
+    Returns (bridge, added_sources); rate-limit sleeps are skipped. The
+    unpatched asyncio.sleep is kept as ``.real_sleep`` for fakes that need
+    to yield.
+    """
+    import asyncio
+    from types import SimpleNamespace
+    import ai.notebooklm_bridge as nb_bridge
+
+    added_sources = []
+
+    class FakeChat:
+        def __init__(self, ask):
+            self.ask = ask
+
+    class FakeSources:
+        async def add_text(self, nb_id, **kwargs):
+            added_sources.append(kwargs)
+            return SimpleNamespace(title=kwargs["title"])
+
+    class FakeNotebooks:
+        async def create(self, title):
+            return SimpleNamespace(id="nb1", title=title)
+
+    async def no_sleep(_):
+        pass
+
+    async def no_start(self):
+        pass
+
+    monkeypatch.setattr(nb_bridge.NotebookLMBridge, "_ensure_running", no_start)
+    real_sleep = asyncio.sleep
+    monkeypatch.setattr(nb_bridge.asyncio, "sleep", no_sleep)
+
+    def make(ask):
+        bridge = nb_bridge.NotebookLMBridge()
+        bridge._client = SimpleNamespace(
+            chat=FakeChat(ask), sources=FakeSources(), notebooks=FakeNotebooks(),
+        )
+        return bridge, added_sources
+
+    make.real_sleep = real_sleep
+    return make
+
+
+class TestBridgeAnswerCallback:
+    def test_answers_reported_as_they_arrive(self, fake_bridge):
+        import asyncio
+        from types import SimpleNamespace
+
+        events = []
+
+        async def ask(nb_id, question, conversation_id=None):
+            events.append(("ask", question))
+            if question == "q2?":
+                raise RuntimeError("quota")
+            return SimpleNamespace(answer=f"answer to {question}", conversation_id="c1")
+
+        bridge, _ = fake_bridge(ask)
+        result = asyncio.run(bridge.create_and_query(
+            comments_md="# comments",
+            topic="t",
+            queries=[{"id": "a", "question": "q1?"}, {"id": "b", "question": "q2?"}],
+            keep_alive=True,
+            answer_cb=lambda qid, ans: events.append(("answer", qid, ans)),
+        ))
+
+        assert events == [
+            ("ask", "q1?"), ("answer", "a", "answer to q1?"),
+            ("ask", "q2?"), ("answer", "b", ""),
+        ]
+        assert result["answers"] == {"a": "answer to q1?", "b": ""}
+
+    def test_concurrent_queries_bounded_and_ordered(self, fake_bridge):
+        import asyncio
+        from types import SimpleNamespace
+
+        in_flight = 0
+        peak = 0
+        conversations = {}
+
+        async def ask(nb_id, question, conversation_id=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            conversations[question] = conversation_id
+            await fake_bridge.real_sleep(0.01)
+            in_flight -= 1
+            return SimpleNamespace(answer=question.upper(), conversation_id=f"c-{question}")
+
+        bridge, _ = fake_bridge(ask)
+        queries = [{"id": f"q{i}", "question": f"q{i}?"} for i in range(6)]
+        result = asyncio.run(bridge.create_and_query(
+            comments_md="# comments", topic="t", queries=queries,
+            keep_alive=True, concurrency=2,
+        ))
+
+        assert peak == 2
+        assert list(result["answers"]) == [q["id"] for q in queries]
+        assert result["answers"]["q3"] == "Q3?"
+        # The first query's conversation is the one kept for chat
+        assert result["conversation_id"] == "c-q0?"
+        assert set(conversations.values()) == {None}
+
+    def test_needs_history_queries_run_last_in_conversation(self, fake_bridge):
+        import asyncio
+        from types import SimpleNamespace
+
+        asked = []
+
+        async def ask(nb_id, question, conversation_id=None):
+            asked.append((question, conversation_id))
+            return SimpleNamespace(answer=question.upper(), conversation_id="conv")
+
+        bridge, added_sources = fake_bridge(ask)
+        queries = [{"id": f"q{i}", "question": f"q{i}?"} for i in range(5)]
+        queries[2]["needs_history"] = True
+        result = asyncio.run(bridge.create_and_query(
+            comments_md="# comments", topic="t", queries=queries,
+            keep_alive=True, concurrency=3,
+        ))
+
+        # Independent queries first (only q0 in the conversation), then q2
+        # in the kept conversation with the earlier answers as a source
+        assert asked[0] == ("q0?", None)
+        assert sorted(asked[1:4]) == [("q1?", None), ("q3?", None), ("q4?", None)]
+        assert asked[4] == ("q2?", "conv")
+        earlier = added_sources[-1]["content"]
+        assert all(f"Q{i}?" in earlier for i in (0, 1, 3, 4))
+        assert list(result["answers"]) == [q["id"] for q in queries]
+
+    def test_toolkit_history_queries_flagged(self):
+        from ai.toolkit_queries import get_toolkit_queries
+
+        queries = get_toolkit_queries("t", 10, ["youtube"])
+        flagged = [q["id"] for q in queries if q.get("needs_history")]
+        assert flagged == ["persona_interview", "full_synthesis"]
+
+
 # ═══════════════════════════════════════════════════════════════════
 # Edge case / robustness tests for parser
 # ═══════════════════════════════════════════════════════════════════
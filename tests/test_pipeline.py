@@ -0,0 +1,315 @@
+"""Tests for the One Search step functions in search/pipeline.py."""
+
+import asyncio
+
+import pytest
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Tests for step_search_urls_async — concurrent per-platform search
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestStepSearchUrlsAsync:
+    def test_matches_sync_result_shape(self, monkeypatch):
+        import search.pipeline as pipeline
+
+        def fake_search(queries, **kwargs):
+            return {
+                p: [{"url": f"https://{p}.com/{i}", "title": f"{p} {i}", "snippet": ""}
+                    for i in range(3)]
+                for p in queries
+            }
+
+        monkeypatch.setattr(pipeline, "search_multi_queries", fake_search)
+        monkeypatch.setattr(
+            pipeline, "extract_urls_from_results",
+            lambda results, platform: [r["url"] for r in results],
+        )
+
+        queries = {"youtube": ["a"], "tiktok": ["b"]}
+        sync_result = pipeline.step_search_urls(
+            queries, ["youtube", "tiktok"], max_urls_per_platform=2,
+        )
+        async_result = asyncio.run(pipeline.step_search_urls_async(
+            queries, ["youtube", "tiktok"], max_urls_per_platform=2,
+        ))
+
+        assert async_result == sync_result
+        assert [d["url"] for d in async_result["url_map_detail"]["tiktok"]] == [
+            "https://tiktok.com/0", "https://tiktok.com/1",
+        ]
+
+    def test_progress_runs_on_loop_thread(self, monkeypatch):
+        import threading
+        import search.pipeline as pipeline
+
+        def fake_search(queries, progress_callback=None, **kwargs):
+            for p in queries:
+                progress_callback(f"Searching {p}")
+            return {p: [] for p in queries}
+
+        monkeypatch.setattr(pipeline, "search_multi_queries", fake_search)
+
+        threads = set()
+        messages = []
+
+        def on_progress(msg):
+            threads.add(threading.get_ident())
+            messages.append(msg)
+
+        async def run():
+            threads.add(threading.get_ident())
+            return await pipeline.step_search_urls_async(
+                {"youtube": ["a"], "facebook": ["b"]},
+                ["youtube", "facebook"],
+                progress_callback=on_progress,
+            )
+
+        asyncio.run(run())
+        assert len(threads) == 1
+        assert "Searching youtube" in messages
+        assert "Searching facebook" in messages
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Tests for step_scrape_and_analyze — streaming per-URL results
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestScrapeResultQueue:
+    def test_streams_items_then_sentinel(self, monkeypatch):
+        import search.pipeline as pipeline
+
+        async def fake_scrape(url_map, result_queue=None, **kwargs):
+            raw = {}
+            for platform, urls in url_map.items():
+                raw[platform] = []
+                for url in urls:
+                    comments = [{"text": f"comment on {url}"}]
+                    raw[platform].extend(comments)
+                    await result_queue.put(
+                        {"platform": platform, "url": url, "comments": comments}
+                    )
+            return raw
+
+        monkeypatch.setattr(pipeline, "scrape_all_platforms", fake_scrape)
+        monkeypatch.setattr(pipeline, "normalize_comments", lambda c, p: list(c))
+
+        async def run():
+            queue = asyncio.Queue()
+            result = await pipeline.step_scrape_and_analyze(
+                url_map={"youtube": ["u1", "u2"]},
+                platforms=["youtube"],
+                result_queue=queue,
+            )
+            items = []
+            while (item := queue.get_nowait()) is not None:
+                items.append(item)
+            return result, items
+
+        result, items = asyncio.run(run())
+        assert [i["url"] for i in items] == ["u1", "u2"]
+        assert result["total_comments"] == 2
+
+    def test_sentinel_sent_on_failure(self, monkeypatch):
+        import search.pipeline as pipeline
+
+        async def failing_scrape(**kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(pipeline, "scrape_all_platforms", failing_scrape)
+
+        async def run():
+            queue = asyncio.Queue()
+            with pytest.raises(RuntimeError):
+                await pipeline.step_scrape_and_analyze(
+                    url_map={"youtube": ["u1"]},
+                    platforms=["youtube"],
+                    result_queue=queue,
+                )
+            return queue.get_nowait()
+
+        assert asyncio.run(run()) is None
+
+
+class TestScrapeAllPlatformsConcurrency:
+    def test_bounded_and_keeps_order(self, monkeypatch):
+        import search.orchestrator as orchestrator
+
+        running = 0
+        peak = 0
+
+        async def fake_platform(platform, urls, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return [{"text": u} for u in urls]
+
+        monkeypatch.setattr(orchestrator, "scrape_platform_urls", fake_platform)
+
+        url_map = {"tiktok": ["t1"], "youtube": ["y1", "y2"], "facebook": [], "instagram": ["i1"]}
+        result = asyncio.run(orchestrator.scrape_all_platforms(url_map, concurrency=2))
+
+        assert peak == 2
+        assert list(result) == ["tiktok", "youtube", "instagram"]
+        assert result["youtube"] == [{"text": "y1"}, {"text": "y2"}]
+
+
+class TestSearchResultCache:
+    def test_repeat_query_skips_backend(self, monkeypatch):
+        import search.google_search as gs
+
+        calls = []
+
+        def fake_serper(query, max_results, gl, hl):
+            calls.append(query)
+            return [{"url": "https://youtube.com/watch?v=1", "title": "t", "snippet": ""}]
+
+        monkeypatch.setattr(gs, "_search_serper", fake_serper)
+        monkeypatch.setattr(gs, "_search_cache", gs.LRUCache(8))
+
+        first = gs.search_google("site:youtube.com tesla")
+        first.clear()  # callers get their own list
+        second = gs.search_google("site:youtube.com tesla")
+
+        assert calls == ["site:youtube.com tesla"]
+        assert second[0]["url"] == "https://youtube.com/watch?v=1"
+
+    def test_empty_results_not_cached(self, monkeypatch):
+        import search.google_search as gs
+
+        calls = []
+
+        def empty(*args, **kwargs):
+            calls.append(args[0])
+            return []
+
+        for name in ("_search_serper", "_search_serpapi", "_search_ddg"):
+            monkeypatch.setattr(gs, name, empty)
+        monkeypatch.setattr(gs, "_search_cache", gs.LRUCache(8))
+
+        gs.search_google("nothing")
+        gs.search_google("nothing")
+        assert len(calls) == 6
+
+    def test_other_api_key_does_not_share_results(self, monkeypatch):
+        import search.google_search as gs
+
+        calls = []
+
+        def fake_serper(query, max_results, gl, hl):
+            calls.append(query)
+            return [{"url": "https://youtube.com/watch?v=1", "title": "t", "snippet": ""}]
+
+        monkeypatch.setattr(gs, "_search_serper", fake_serper)
+        monkeypatch.setattr(gs, "_search_cache", gs.LRUCache(8))
+
+        monkeypatch.setattr(gs, "_get_serper_key", lambda: "key-a")
+        gs.search_google("tesla")
+        gs.search_google("tesla")
+        monkeypatch.setattr(gs, "_get_serper_key", lambda: "key-b")
+        gs.search_google("tesla")
+
+        assert calls == ["tesla", "tesla"]
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Tests for utils/http.py — scrapers' shared connection pool
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestSharedConnectionPool:
+    def test_pool_shared_within_call_and_closed_after(self):
+        from utils.http import pooled, shared_session
+
+        async def scrape():
+            async with shared_session() as a, shared_session() as b:
+                assert a.connector is b.connector
+                async with shared_session(limit_per_host=7) as c:
+                    assert c.connector is not a.connector
+                    assert c.connector.limit_per_host == 7
+                return a.connector
+
+        connector = asyncio.run(pooled(scrape()))
+        assert connector.closed
+
+    def test_session_owns_connector_outside_pool(self):
+        from utils.http import shared_session
+
+        async def scrape():
+            async with shared_session() as session:
+                connector = session.connector
+            return connector
+
+        assert asyncio.run(scrape()).closed
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Tests for query display helpers — operator stripping + dedup
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestStripGoogleOperators:
+    def test_strips_all_operators(self):
+        from search.pipeline import strip_google_operators
+
+        q = "site:youtube.com/shorts  intitle:tesla review -inurl:ads after:2024-01-01"
+        # Only the prefix of intitle:/inurl: is an operator; its term stays
+        assert strip_google_operators(q) == "tesla review ads"
+
+    def test_plain_query_fast_path(self):
+        from search.pipeline import strip_google_operators
+
+        assert strip_google_operators("  tesla review ") == "tesla review"
+        assert strip_google_operators("tesla\t  review") == "tesla review"
+
+    def test_unique_clean_queries_dedupes_after_stripping(self):
+        from search.pipeline import unique_clean_queries
+
+        queries = (
+            "site:tiktok.com tesla review",
+            "tesla review after:2024-01-01",
+            "site:tiktok.com",
+            "model 3 range",
+        )
+        assert unique_clean_queries(queries) == ("tesla review", "model 3 range")
+
+
+# ═══════════════════════════════════════════════════════════════════
+# Tests for the LLM query strategy cache
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestStrategyCache:
+    def test_repeat_topic_skips_llm(self, monkeypatch):
+        pytest.importorskip("pythainlp")
+        import ai.client
+        import search.intelligent_query_builder as iqb
+
+        calls = []
+
+        class FakeClient:
+            provider = "fake"
+            api_key = "key-a"
+
+            async def analyze(self, prompt, data=""):
+                calls.append(data)
+                return {"platform_queries": {"youtube": ["tesla review"]}}
+
+        monkeypatch.setattr(ai.client, "LLMClient", FakeClient)
+        monkeypatch.setattr(iqb, "_llm_cache", iqb.LRUCache(8))
+
+        first = asyncio.run(iqb._strategize_with_llm("Tesla  Review", ["youtube"], "any", 5))
+        first.queries["youtube"].append("edited")
+        second = asyncio.run(iqb._strategize_with_llm("tesla review", ["youtube"], "any", 5))
+
+        assert len(calls) == 1
+        assert second.queries == {"youtube": ["tesla review"]}
+
+        # Another API key pays for its own strategy
+        FakeClient.api_key = "key-b"
+        asyncio.run(iqb._strategize_with_llm("tesla review", ["youtube"], "any", 5))
+        assert len(calls) == 2
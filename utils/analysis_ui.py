@@ -208,18 +208,17 @@ def _render_temporal(data: dict):
             st.bar_chart(df_hour.set_index("Hour"), height=250)
 
 
-def render_platform_comparison(result: dict):
-    """Render cross-platform comparison dashboard.
+def compose_platform_comparison(comments: list[dict]) -> dict | None:
+    """Compute the cross-platform comparison data.
 
-    Only shown when 2+ platforms have comments.
-    Uses AI tags (ai_sentiment) if available, otherwise falls back to raw counts.
+    Returns None unless 2+ platforms have comments. Kept separate from
+    render_platform_comparison() so callers can compute it once per result.
     """
     import pandas as pd
     from collections import Counter
 
-    comments = result.get("comments_clean", [])
     if not comments:
-        return
+        return None
 
     # Group by platform
     by_platform: dict[str, list[dict]] = {}
@@ -230,75 +229,97 @@ def render_platform_comparison(result: dict):
     # Only show if 2+ platforms have data
     platforms_with_data = {p: cs for p, cs in by_platform.items() if cs}
     if len(platforms_with_data) < 2:
-        return
-
-    st.markdown("---")
-    st.markdown("### Cross-Platform Comparison")
+        return None
 
     # --- Sentiment distribution per platform ---
     has_ai_tags = any(c.get("ai_sentiment") for c in comments)
 
-    sentiment_data = []
-    for platform, cs in sorted(platforms_with_data.items()):
-        counts = Counter()
-        for c in cs:
-            if has_ai_tags:
-                s = c.get("ai_sentiment", "neutral")
-            else:
-                s = "neutral"
-            counts[s] += 1
-        total = len(cs)
-        for sent in ["positive", "neutral", "negative", "mixed"]:
-            pct = round(counts.get(sent, 0) / total * 100, 1) if total else 0
-            sentiment_data.append({
-                "Platform": platform.title(),
-                "Sentiment": sent.title(),
-                "Percentage": pct,
-            })
-
-    if has_ai_tags and sentiment_data:
-        st.markdown("#### Sentiment by Platform")
+    sentiment_pivot = None
+    if has_ai_tags:
+        sentiment_data = []
+        for platform, cs in sorted(platforms_with_data.items()):
+            counts = Counter(c.get("ai_sentiment", "neutral") for c in cs)
+            total = len(cs)
+            for sent in ["positive", "neutral", "negative", "mixed"]:
+                pct = round(counts.get(sent, 0) / total * 100, 1) if total else 0
+                sentiment_data.append({
+                    "Platform": platform.title(),
+                    "Sentiment": sent.title(),
+                    "Percentage": pct,
+                })
+
         df_sent = pd.DataFrame(sentiment_data)
         # Pivot for grouped bar chart
         df_pivot = df_sent.pivot(index="Platform", columns="Sentiment", values="Percentage").fillna(0)
         # Reorder columns
         col_order = [c for c in ["Positive", "Neutral", "Negative", "Mixed"] if c in df_pivot.columns]
-        df_pivot = df_pivot[col_order]
-        st.bar_chart(df_pivot, height=300)
+        sentiment_pivot = df_pivot[col_order]
+
+    # --- Engagement and top keywords per platform ---
+    platforms = []
+    for platform, cs in sorted(platforms_with_data.items()):
+        total_likes = sum(c.get("likes", 0) for c in cs)
+        replies = sum(1 for c in cs if c.get("is_reply"))
+
+        # Simple frequency-based keywords
+        words = Counter()
+        for c in cs:
+            text = c.get("text", "").lower()
+            for w in text.split():
+                w = w.strip(".,!?;:\"'()[]{}#@")
+                if len(w) > 2 and w not in _STOP_WORDS:
+                    words[w] += 1
+
+        platforms.append({
+            "name": platform,
+            "comments": len(cs),
+            "avg_likes": round(total_likes / len(cs), 1),
+            "reply_rate": round(replies / len(cs) * 100, 1),
+            "top_keywords": words.most_common(10),
+        })
+
+    return {"sentiment_pivot": sentiment_pivot, "platforms": platforms}
+
+
+def render_platform_comparison(comparison: dict | None):
+    """Render cross-platform comparison dashboard.
+
+    Takes the output of compose_platform_comparison(); renders nothing when
+    it is None (fewer than 2 platforms with comments). Uses AI tags
+    (ai_sentiment) for the sentiment chart when available.
+    """
+    if not comparison:
+        return
+
+    st.markdown("---")
+    st.markdown("### Cross-Platform Comparison")
+
+    if comparison["sentiment_pivot"] is not None:
+        st.markdown("#### Sentiment by Platform")
+        st.bar_chart(comparison["sentiment_pivot"], height=300)
+
+    platforms = comparison["platforms"]
 
     # --- Engagement comparison ---
     st.markdown("#### Engagement by Platform")
-    eng_cols = st.columns(len(platforms_with_data))
-    for i, (platform, cs) in enumerate(sorted(platforms_with_data.items())):
+    eng_cols = st.columns(len(platforms))
+    for i, p in enumerate(platforms):
         with eng_cols[i]:
-            total_likes = sum(c.get("likes", 0) for c in cs)
-            avg_likes = round(total_likes / len(cs), 1) if cs else 0
-            replies = sum(1 for c in cs if c.get("is_reply"))
-            reply_rate = round(replies / len(cs) * 100, 1) if cs else 0
-            st.markdown(f"**{platform.title()}**")
-            st.metric("Comments", f"{len(cs):,}")
-            st.metric("Avg Likes", f"{avg_likes}")
-            st.metric("Reply Rate", f"{reply_rate}%")
+            st.markdown(f"**{p['name'].title()}**")
+            st.metric("Comments", f"{p['comments']:,}")
+            st.metric("Avg Likes", f"{p['avg_likes']}")
+            st.metric("Reply Rate", f"{p['reply_rate']}%")
 
     # --- Top keywords per platform ---
     st.markdown("#### Top Keywords by Platform")
-    kw_cols = st.columns(len(platforms_with_data))
-    for i, (platform, cs) in enumerate(sorted(platforms_with_data.items())):
+    kw_cols = st.columns(len(platforms))
+    for i, p in enumerate(platforms):
         with kw_cols[i]:
-            st.markdown(f"**{platform.title()}**")
-            # Simple frequency-based keywords
-            from collections import Counter
-            words = Counter()
-            for c in cs:
-                text = c.get("text", "").lower()
-                for w in text.split():
-                    w = w.strip(".,!?;:\"'()[]{}#@")
-                    if len(w) > 2 and w not in _STOP_WORDS:
-                        words[w] += 1
-            top_kw = words.most_common(10)
-            if top_kw:
-                for word, count in top_kw:
-                    st.markdown(f"- **{word}** ({count})")
+            st.markdown(f"**{p['name'].title()}**")
+            if p["top_keywords"]:
+                st.markdown("\n".join(
+                    f"- **{word}** ({count})" for word, count in p["top_keywords"]
+                ))
             else:
                 st.caption("No keywords")
 
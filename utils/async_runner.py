@@ -13,6 +13,13 @@ calls work from the child thread.
 import asyncio
 import threading
 
+# Optional: uvloop — a faster event loop for the scrapers' network I/O
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
 
 def _get_streamlit_ctx():
     """Get the current Streamlit ScriptRunContext (if running in Streamlit)."""
@@ -42,7 +49,9 @@ def run_async(coro):
     asyncio.current_task() to return a proper task.
 
     The Streamlit ScriptRunContext is propagated to the child thread so
-    that st.session_state and UI placeholder updates work correctly.
+    that st.session_state and UI placeholder updates work correctly. That
+    context is per thread, so the loop can't be shared across calls (or
+    sessions); uvloop is used for it when installed.
 
     Args:
         coro: An awaitable coroutine
@@ -59,10 +68,14 @@ def run_async(coro):
 
     def _target():
         try:
-            loop = asyncio.new_event_loop()
+            loop = _new_event_loop()
             asyncio.set_event_loop(loop)
-            result[0] = loop.run_until_complete(coro)
-            loop.close()
+            try:
+                # The scrapers share one connection pool for the call
+                from utils.http import pooled
+                result[0] = loop.run_until_complete(pooled(coro))
+            finally:
+                loop.close()
         except Exception as e:
             error[0] = e
 
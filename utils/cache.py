@@ -0,0 +1,60 @@
+"""
+In-process caches for results bought with an API key.
+
+Streamlit serves every browser session from one process, so a module-level
+cache is shared by all of them. The policy for such caches:
+
+- Every key includes key_fingerprint() of the API key that paid for the
+  value, so a cached result is only served to callers using the same key.
+- All access goes through the cache's lock — searches run on worker
+  threads (asyncio.to_thread), several at a time.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Short, non-reversible identity of an API key for use in cache keys."""
+    if not api_key:
+        return ""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+class LRUCache:
+    """Thread-safe LRU cache, with optional expiry after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()  # key → (time, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value, or None when missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
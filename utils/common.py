@@ -6,7 +6,9 @@ import asyncio
 import csv
 import io
 import json
+import os
 import re
+from functools import lru_cache
 
 
 class AdaptiveDelay:
@@ -30,6 +32,25 @@ class AdaptiveDelay:
         self.delay = min(self.max_delay, self.delay * 3.0)
 
 
+def load_css(path) -> str:
+    """Return the stylesheet at path, or "" if it doesn't exist.
+
+    Pages inject the stylesheet on every rerun; the text is cached per
+    file modification time, so edits still show up without a restart.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return ""
+    return _read_text(str(path), mtime)
+
+
+@lru_cache(maxsize=8)
+def _read_text(path: str, mtime_ns: int) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
 def fmt_num(n) -> str:
     """Format a number with K/M suffixes for display."""
     if not isinstance(n, (int, float)):
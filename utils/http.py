@@ -0,0 +1,80 @@
+"""
+Shared aiohttp connection pool for the async scrapers.
+
+Every scraper used to open its own TCPConnector per video/post, so each
+URL paid for fresh DNS lookups and TLS handshakes. Sessions created via
+shared_session() inside pooled() instead draw from one pool per event
+loop, so the videos/posts of one call reuse open connections.
+
+The pool lives for one pooled() call: a connector is bound to the loop
+that created it, and run_async() runs each call on its own loop, so
+connections are not kept across reruns. Outside pooled() (e.g. a scraper
+driven by asyncio.run()), each session owns its connector and closes it
+on exit.
+"""
+
+import asyncio
+import weakref
+
+import aiohttp
+
+
+# Per-host cap of the default pool, matching the strictest of the
+# scrapers' old pools (YouTube replies used 5), so sharing a pool doesn't
+# raise the parallelism a platform sees and risk rate limits or blocks
+DEFAULT_LIMIT_PER_HOST = 5
+
+# event loop → {limit_per_host: TCPConnector}, for loops inside pooled()
+_pools = weakref.WeakKeyDictionary()
+
+
+def _new_connector(limit_per_host: int) -> aiohttp.TCPConnector:
+    return aiohttp.TCPConnector(
+        limit=50,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=300,
+        keepalive_timeout=30,
+    )
+
+
+def get_connector(
+    limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+) -> aiohttp.TCPConnector | None:
+    """Get (or lazily create) the running loop's pool for this per-host cap.
+
+    Returns None when no pool is open on the loop (outside pooled()).
+    """
+    pools = _pools.get(asyncio.get_running_loop())
+    if pools is None:
+        return None
+    connector = pools.get(limit_per_host)
+    if connector is None or connector.closed:
+        connector = pools[limit_per_host] = _new_connector(limit_per_host)
+    return connector
+
+
+def shared_session(
+    limit_per_host: int = DEFAULT_LIMIT_PER_HOST, **kwargs,
+) -> aiohttp.ClientSession:
+    """Create a ClientSession backed by the shared connection pool.
+
+    Headers, cookies, and cookie jars stay per-session, so scrapers keep
+    their own auth state while reusing open connections. Scrapers that
+    run their own bounded fan-out pass a matching limit_per_host.
+    """
+    connector = get_connector(limit_per_host)
+    if connector is None:
+        return aiohttp.ClientSession(connector=_new_connector(limit_per_host), **kwargs)
+    return aiohttp.ClientSession(connector=connector, connector_owner=False, **kwargs)
+
+
+async def pooled(coro):
+    """Await *coro* with connection pooling, closing the pools afterwards."""
+    loop = asyncio.get_running_loop()
+    _pools[loop] = {}
+    try:
+        return await coro
+    finally:
+        for connector in _pools.pop(loop, {}).values():
+            if not connector.closed:
+                await connector.close()
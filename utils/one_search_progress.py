@@ -5,6 +5,9 @@ Enhanced multi-step progress tracker for One Search pipeline.
 import streamlit as st
 
 
+# Interactive workflow steps shown in the One Search step bar
+STEP_LABELS = ["Input", "Queries", "URLs", "Scraping", "Results"]
+
 PIPELINE_STEPS = [
     {"label": "Searching for relevant content", "icon": "1"},
     {"label": "Collecting URLs across platforms", "icon": "2"},
@@ -66,6 +69,11 @@ class OneSearchProgress:
 
         self._render()
 
+    def set_comment_count(self, count: int):
+        """Update the live comment counter, keeping the current message."""
+        self.comment_count = max(self.comment_count, count)
+        self._render()
+
     def complete(self, total_comments: int):
         """Mark the pipeline as complete."""
         self.done = True
@@ -135,3 +143,37 @@ class OneSearchProgress:
         )
 
         self.placeholder.markdown(html, unsafe_allow_html=True)
+
+
+def _build_step_indicator_html(current_step: int) -> str:
+    """Build the One Search step bar HTML for one step."""
+    parts = []
+    for i, label in enumerate(STEP_LABELS):
+        if i < current_step:
+            cls, icon = "osstep-done", "&#10003;"
+        else:
+            cls = "osstep-active" if i == current_step else "osstep-pending"
+            icon = i + 1
+        if i > 0:
+            parts.append('<span class="osstep-connector"></span>')
+        parts.append(
+            f'<span class="osstep {cls}">'
+            f'<span class="osstep-icon">{icon}</span>'
+            f'<span class="osstep-label">{label}</span>'
+            f'</span>'
+        )
+
+    # Styles live in assets/style.css, which every page already injects
+    return f'<div class="osstep-bar">{"".join(parts)}</div>'
+
+
+# One step bar per step, built once at import. The page script is re-executed
+# on every rerun, so it only indexes into this tuple.
+_STEP_INDICATOR_HTML = tuple(
+    _build_step_indicator_html(i) for i in range(len(STEP_LABELS))
+)
+
+
+def step_indicator_html(current_step: int) -> str:
+    """Return the prebuilt step bar HTML for the given step."""
+    return _STEP_INDICATOR_HTML[current_step]
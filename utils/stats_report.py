@@ -74,13 +74,27 @@ def compose_stats_report(analysis: dict) -> dict | None:
     # --- Temporal ---
     temporal = analysis.get("temporal")
     if temporal:
+        import pandas as pd
+
+        by_date = temporal.get("by_date", [])
+        by_hour = temporal.get("by_hour", [])
         report["temporal"] = {
             "peak_hour": temporal.get("peak_hour"),
             "peak_day": temporal.get("peak_day"),
             "date_range": temporal.get("date_range", {}),
-            "by_date": temporal.get("by_date", []),
-            "by_hour": temporal.get("by_hour", []),
+            "by_date": by_date,
+            "by_hour": by_hour,
             "reason": temporal.get("reason"),
+            # Chart-ready frames, built with the report so a cached report
+            # doesn't rebuild them on every render
+            "date_chart": (
+                pd.DataFrame(by_date, columns=["Date", "Comments"]).set_index("Date")
+                if by_date else None
+            ),
+            "hour_chart": (
+                pd.DataFrame(by_hour, columns=["Hour", "Comments"]).set_index("Hour")
+                if by_hour else None
+            ),
         }
 
     # --- Auto-generated executive summary ---
@@ -206,9 +220,10 @@ def render_stats_report(report: dict):
 
                 # Bigrams
                 if kw.get("bigrams"):
-                    st.markdown("**Top Phrases** (Bigrams)")
-                    for phrase, count in kw["bigrams"][:8]:
-                        st.markdown(f"- **{phrase}** ({count})")
+                    st.markdown("\n".join(
+                        ["**Top Phrases** (Bigrams)"]
+                        + [f"- **{phrase}** ({count})" for phrase, count in kw["bigrams"][:8]]
+                    ))
 
             with col_wc:
                 wc_bytes = kw.get("wordcloud_bytes")
@@ -263,9 +278,11 @@ def render_stats_report(report: dict):
                         )
             with col_active:
                 if eng.get("most_active_users"):
-                    st.markdown("**Most Active Users**")
-                    for user, count in eng["most_active_users"]:
-                        st.markdown(f"- **@{user}** — {count} comments")
+                    st.markdown("\n".join(
+                        ["**Most Active Users**"]
+                        + [f"- **@{user}** — {count} comments"
+                           for user, count in eng["most_active_users"]]
+                    ))
 
     # --- Temporal Patterns ---
     temp = report.get("temporal")
@@ -274,8 +291,6 @@ def render_stats_report(report: dict):
             pass  # Skip if temporal had insufficient data
         else:
             with st.expander("Temporal Patterns", expanded=False):
-                import pandas as pd
-
                 tm1, tm2, tm3 = st.columns(3)
                 if temp.get("peak_hour") is not None:
                     tm1.metric("Peak Hour", f"{temp['peak_hour']}:00")
@@ -287,16 +302,12 @@ def render_stats_report(report: dict):
 
                 col_date, col_hour = st.columns(2)
                 with col_date:
-                    by_date = temp.get("by_date", [])
-                    if by_date:
-                        df_date = pd.DataFrame(by_date, columns=["Date", "Comments"])
-                        st.line_chart(df_date.set_index("Date"), height=200)
+                    if temp.get("date_chart") is not None:
+                        st.line_chart(temp["date_chart"], height=200)
 
                 with col_hour:
-                    by_hour = temp.get("by_hour", [])
-                    if by_hour:
-                        df_hour = pd.DataFrame(by_hour, columns=["Hour", "Comments"])
-                        st.bar_chart(df_hour.set_index("Hour"), height=200)
+                    if temp.get("hour_chart") is not None:
+                        st.bar_chart(temp["hour_chart"], height=200)
 
 
 def _render_sentiment_bar(positive: int, neutral: int, negative: int):